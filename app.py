@@ -1,11 +1,13 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from io import BytesIO
-import tempfile
 import os
-import zipfile
-import re
-from extractors import PdfPlumberExtractor, TabulaExtractor, TextExtractor, RedeBizExtractor, MondelezExtractor, SilveiraExtractor, BernardaoExtractor, BernardaoV2Extractor, TresIrmaosExtractor, RedeLucasExtractor, SupermaxiExtractor, KamelExtractor, BomPrecoExtractor, TABULA_AVAILABLE, KiJoiaExtractor, ZebuExtractor
+import multiprocessing
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from extractors import extrair_pdf, marcar_worker_de_pool, PdfPlumberExtractor, TabulaExtractor, TextExtractor, RedeBizExtractor, MondelezExtractor, SilveiraExtractor, BernardaoExtractor, BernardaoV2Extractor, TresIrmaosExtractor, RedeLucasExtractor, SupermaxiExtractor, KamelExtractor, BomPrecoExtractor, TABULA_AVAILABLE, KiJoiaExtractor, ZebuExtractor
 
 st.set_page_config(
     page_title="Conversor PDF para Excel",
@@ -19,6 +21,194 @@ st.markdown("Extraia tabelas de arquivos PDF e converta para Excel facilmente!")
 # Número do WhatsApp (formato: código do país + DDD + número)
 WHATSAPP_NUMBER = "553492182544"
 
+# Limite de linhas enviadas ao navegador na prévia de cada tabela
+LINHAS_PREVIEW = 200
+
+# Teto de processos do pool de extração: cada worker fica residente com pandas e
+# pdfplumber carregados (~150 MB), e o cpu_count pode ser o da máquina inteira
+MAX_WORKERS_EXTRACAO = 4
+
+# Função para ajustar header
+def ajusta_header(df):
+    cols = df.columns.astype(str)
+    primeira = df.iloc[0].astype(str).to_numpy()
+    sem_nome = cols.str.startswith('Unnamed').to_numpy()
+    df.columns = np.where(sem_nome, primeira, cols.to_numpy() + ' ' + primeira)
+    return df.iloc[1:].reset_index(drop=True)
+
+# Método escolhido na barra lateral -> fábrica do extrator (busca pelo texto exato da opção).
+# As fábricas precisam ser serializáveis (classe ou partial) para irem ao processo de extração.
+METHOD_DISPATCH = {
+    "REDE BIZ (Pedidos TOTVS)": RedeBizExtractor,
+    "Rede Biz - KAMEL": KamelExtractor,
+    "ZEBU Carnes Supermercados": ZebuExtractor,
+    "Silveira Supermercado": SilveiraExtractor,
+    "Bernardão Supermercado": BernardaoExtractor,
+    "BERNARDÃO V2 (Rede Biz)": BernardaoV2Extractor,
+    "3 Irmãos Supermercado": TresIrmaosExtractor,
+    "REDE LUCAS": RedeLucasExtractor,
+    "SUPERMAXI": SupermaxiExtractor,
+    "BOM PREÇO": BomPrecoExtractor,
+    "KI JOIA": KiJoiaExtractor,
+    "PDFPlumber (recomendado)": PdfPlumberExtractor,
+    "Texto (extração inteligente)": TextExtractor,
+    "Lattice (Tabula - bordas)": partial(TabulaExtractor, mode="lattice"),
+    "Stream (Tabula - sem bordas)": partial(TabulaExtractor, mode="stream"),
+    "Automático (Tabula)": partial(TabulaExtractor, mode="auto"),
+}
+
+OPCOES_EXTRACAO = [
+    "REDE BIZ (Pedidos TOTVS)",
+    "Rede Biz - KAMEL",
+    "ZEBU Carnes Supermercados",
+    "Silveira Supermercado",
+    "Bernardão Supermercado",
+    "BERNARDÃO V2 (Rede Biz)",
+    "3 Irmãos Supermercado",
+    "REDE LUCAS",
+    "SUPERMAXI",
+    "BOM PREÇO",
+    "KI JOIA",
+    "PDFPlumber (recomendado)",
+    "Texto (extração inteligente)"
+] + (["Lattice (Tabula - bordas)", "Stream (Tabula - sem bordas)", "Automático (Tabula)"] if TABULA_AVAILABLE else [])
+
+@st.cache_resource
+def pool_extracao():
+    """
+    Pool de processos compartilhado entre sessões e reruns.
+    PyPDF2/pdfplumber são Python puro e seguram o GIL, então vários PDFs só
+    extraem de fato em paralelo em processos separados. 'spawn' evita herdar
+    o estado do servidor do Streamlit via fork. Os PDFs já são paralelos aqui,
+    então o initializer desliga o pool por faixa de páginas dentro dos workers.
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, MAX_WORKERS_EXTRACAO),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=marcar_worker_de_pool
+    )
+
+def extrair_tabelas(pdf_bytes, metodo_extracao):
+    """
+    Extrai as tabelas do PDF com o método escolhido, num processo do pool.
+    Retorna (tabelas, texto de debug do extrator).
+    """
+    fabrica = METHOD_DISPATCH[metodo_extracao]
+    try:
+        return pool_extracao().submit(extrair_pdf, fabrica, pdf_bytes).result()
+    except BrokenProcessPool:
+        # Um worker morreu (falta de memória, PDF malformado derrubando uma biblioteca
+        # nativa) e o pool em cache ficou quebrado para sempre: recria e tenta uma vez
+        pool_extracao.clear()
+        return pool_extracao().submit(extrair_pdf, fabrica, pdf_bytes).result()
+
+def escrever_aba(worksheet, df, formato_header=None):
+    """
+    Escreve o DataFrame linha a linha com write_row, sem passar pelo to_excel do pandas.
+    Com constant_memory o xlsxwriter descarrega cada linha assim que ela é escrita,
+    então as linhas precisam sair em ordem (o to_excel escreve por coluna).
+    """
+    worksheet.write_row(0, 0, [str(c) for c in df.columns], formato_header)
+    # NaN/NA viram None (célula vazia); o xlsxwriter não aceita NaN como número
+    valores = df.astype(object).where(df.notna(), None)
+    for r, linha in enumerate(valores.itertuples(index=False, name=None), 1):
+        worksheet.write_row(r, 0, linha)
+
+def gerar_excel(tabelas, ajustar_headers):
+    """
+    Monta o Excel (uma aba por tabela) a partir das tabelas extraídas.
+    Retorna (bytes do xlsx, lista de (índice, DataFrame) das tabelas exportadas).
+    """
+    # Pular tabelas vazias ou muito pequenas antes de abrir o workbook
+    tabelas = [df for df in tabelas if not df.empty and len(df.columns) >= 2]
+    if not tabelas:
+        return None, []
+
+    output = BytesIO()
+    exportadas = []
+    with pd.ExcelWriter(output, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True, 'strings_to_numbers': False}}) as writer:
+        # Formato inteiro para o EAN: 13 dígitos sem notação científica
+        formato_ean = writer.book.add_format({'num_format': '0'})
+        formato_header = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        for i, df in enumerate(tabelas, 1):
+            # Ajustar headers se solicitado
+            if ajustar_headers:
+                try:
+                    df = ajusta_header(df)
+                except:
+                    pass
+
+            # Converter EAN para número se existir
+            if 'EAN' in df.columns:
+                # Forçar conversão para números, erros viram NaN (que o Excel trata como vazio)
+                # Mas se quiser manter zeros à esquerda, teria que ser string.
+                # O usuário PEDIU para ser número.
+                # Inteiro anulável: sem float64/NaN e sem perda de precisão nos 13 dígitos.
+                # Só quando todos os valores são inteiros; um "789.5" perdido na coluna faria
+                # o astype('Int64') levantar TypeError e derrubar a planilha inteira;
+                # nesse caso fica o float do to_numeric, como era antes
+                ean = pd.to_numeric(df['EAN'], errors='coerce')
+                if ean.dropna().mod(1).eq(0).all():
+                    df['EAN'] = ean.astype('Int64')
+                else:
+                    df['EAN'] = ean
+
+            # Escrever no Excel
+            sheet_name = f'Tabela {i}'
+            # Garantir que sheet_name não exceda 31 chars
+            sheet_name = sheet_name[:31]
+
+            worksheet = writer.book.add_worksheet(sheet_name)
+            if 'EAN' in df.columns:
+                col_ean = df.columns.get_loc('EAN')
+                if isinstance(col_ean, int):
+                    worksheet.set_column(col_ean, col_ean, 18, formato_ean)
+            escrever_aba(worksheet, df, formato_header)
+            exportadas.append((i, df))
+
+    return output.getvalue(), exportadas
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def processar_arquivo(pdf_bytes, metodo_extracao, ajustar_headers):
+    """
+    Extrai as tabelas de um PDF e gera o Excel correspondente.
+    Todo o pipeline fica em cache pelo conteúdo do arquivo + opções, então
+    reruns do Streamlit (prévia, downloads) não processam o PDF de novo.
+    Não faz chamadas ao Streamlit: roda em thread separada e a interface
+    é montada na thread principal a partir do dicionário retornado.
+    """
+    tabelas, debug_text = extrair_tabelas(pdf_bytes, metodo_extracao)
+    resultado = {
+        'encontradas': len(tabelas) if tabelas else 0,
+        'debug_text': debug_text,
+        'dados': None,
+        'exportadas': []
+    }
+    if resultado['encontradas']:
+        resultado['dados'], resultado['exportadas'] = gerar_excel(tabelas, ajustar_headers)
+    return resultado
+
+# Opções de configuração
+st.sidebar.header("⚙️ Configurações")
+
+metodo_extracao = st.sidebar.selectbox(
+    "Método de extração",
+    OPCOES_EXTRACAO,
+    help="Escolha o algoritmo de extração. No Tabula, 'Automático' tenta Lattice e, se não achar nada, "
+         "lê o PDF de novo com Stream; escolher Lattice ou Stream diretamente evita a segunda leitura."
+)
+
+ajustar_headers = st.sidebar.checkbox(
+    "Ajustar cabeçalhos automaticamente",
+    value=False,
+    help="Combina a primeira linha com o cabeçalho quando necessário"
+)
+mostrar_preview = st.sidebar.checkbox(
+    "Mostrar prévia das tabelas",
+    value=True
+)
+
 # Inicializar session state
 if 'limpar' not in st.session_state:
     st.session_state.limpar = False
@@ -41,180 +231,90 @@ with col2:
         st.rerun()
 
 if uploaded_files:
-    # Opções de configuração
-    st.sidebar.header("⚙️ Configurações")
-    
-    opcoes_extracao = [
-        "REDE BIZ (Pedidos TOTVS)",
-        "Rede Biz - KAMEL",
-        "ZEBU Carnes Supermercados",
-        "Silveira Supermercado",
-        "Bernardão Supermercado",
-        "BERNARDÃO V2 (Rede Biz)",
-        "3 Irmãos Supermercado",
-        "REDE LUCAS",
-        "SUPERMAXI",
-        "BOM PREÇO",
-        "KI JOIA",
-        "PDFPlumber (recomendado)", 
-        "Texto (extração inteligente)"
-    ]
-    if TABULA_AVAILABLE:
-        opcoes_extracao.extend(["Lattice (Tabula - bordas)", "Stream (Tabula - sem bordas)", "Automático (Tabula)"])
-    
-    metodo_extracao = st.sidebar.selectbox(
-        "Método de extração",
-        opcoes_extracao,
-        help="Escolha o algoritmo de extração."
-    )
-    
-    ajustar_headers = st.sidebar.checkbox(
-        "Ajustar cabeçalhos automaticamente",
-        value=False,
-        help="Combina a primeira linha com o cabeçalho quando necessário"
-    )
-    mostrar_preview = st.sidebar.checkbox(
-        "Mostrar prévia das tabelas",
-        value=True
-    )
-    
-    # Função para ajustar header
-    def ajusta_header(df):
-        novo_header = []
-        for header_label, first_row_label in zip(df.columns, df.iloc[0]):
-            if str(header_label).startswith('Unnamed'):
-                novo_header.append(str(first_row_label))
-            else:
-                novo_header.append(f'{header_label} {first_row_label}')
-        df.columns = novo_header
-        return df.iloc[1:].reset_index(drop=True)
-    
     # Processar cada arquivo
     resultados = []
     
-    for uploaded_file in uploaded_files:
+    # Cada arquivo é orquestrado numa thread; a extração pesada roda no pool de processos
+    max_workers = min(len(uploaded_files), os.cpu_count() or 1)
+    with st.spinner(f'Extraindo tabelas de {len(uploaded_files)} arquivo(s)...'):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Na ordem do upload: tela, ZIP e Excel mesclado saem sempre na mesma ordem.
+            # Sair do with espera todos terminarem; erros ficam no future de cada arquivo
+            concluidos = [
+                (f, executor.submit(processar_arquivo, f.getvalue(), metodo_extracao, ajustar_headers))
+                for f in uploaded_files
+            ]
+    
+    # ZIP do lote é escrito arquivo a arquivo, sem segunda passada sobre os resultados.
+    # O xlsx já é um zip comprimido, então as entradas vão sem recompressão.
+    zip_buffer = BytesIO()
+    zip_file = None
+    if len(uploaded_files) > 1:
+        import zipfile
+        zip_file = zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED)
+    
+    # Consome a lista para que o resultado de cada arquivo possa ser liberado ao fim da iteração
+    concluidos.reverse()
+    while concluidos:
+        uploaded_file, future = concluidos.pop()
         st.divider()
         st.subheader(f"📄 {uploaded_file.name}")
         
-        # Salvar arquivo temporariamente
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(uploaded_file.read())
-            tmp_path = tmp_file.name
-        
         try:
-            with st.spinner(f'Extraindo tabelas de {uploaded_file.name}...'):
-                tabelas = []
-                
-                # Selecionar extrator
-                extractor = None
-                
-                if "REDE BIZ" in metodo_extracao:
-                    extractor = RedeBizExtractor()
-                elif "KAMEL" in metodo_extracao:
-                    extractor = KamelExtractor()
-                elif "ZEBU" in metodo_extracao:
-                    extractor = ZebuExtractor()
-                elif "Silveira" in metodo_extracao:
-                    extractor = SilveiraExtractor()
-                elif "BERNARDÃO V2" in metodo_extracao:
-                    extractor = BernardaoV2Extractor()
-                elif "Bernardão" in metodo_extracao:
-                    extractor = BernardaoExtractor()
-                elif "3 Irmãos" in metodo_extracao:
-                    extractor = TresIrmaosExtractor()
-                elif "REDE LUCAS" in metodo_extracao:
-                    extractor = RedeLucasExtractor()
-                elif "SUPERMAXI" in metodo_extracao:
-                    extractor = SupermaxiExtractor()
-                elif "BOM PREÇO" in metodo_extracao:
-                    extractor = BomPrecoExtractor()
-                elif "KI JOIA" in metodo_extracao:
-                    extractor = KiJoiaExtractor()
-                elif "PDFPlumber" in metodo_extracao:
-                    extractor = PdfPlumberExtractor()
-                elif "Texto" in metodo_extracao:
-                    extractor = TextExtractor()
-                elif "Lattice" in metodo_extracao:
-                    extractor = TabulaExtractor(mode="lattice")
-                elif "Stream" in metodo_extracao:
-                    extractor = TabulaExtractor(mode="stream")
-                elif "Automático" in metodo_extracao:
-                    extractor = TabulaExtractor(mode="auto")
-                
-                if extractor:
-                    tabelas = extractor.extract(tmp_path)
+            resultado = future.result()
             
-            if not tabelas or len(tabelas) == 0:
+            if not resultado['encontradas']:
                 st.warning(f"⚠️ Nenhuma tabela foi encontrada em {uploaded_file.name}")
-                if hasattr(extractor, 'debug_text') and extractor.debug_text:
+                if resultado['debug_text']:
                     with st.expander("🔍 Debug: Ver texto extraído do PDF"):
-                        st.text_area("Conteúdo bruto:", extractor.debug_text, height=300)
+                        st.text_area("Conteúdo bruto:", resultado['debug_text'], height=300)
                         st.info("Copie este texto e envie para o desenvolvedor adaptar o extrator.")
                 st.info("💡 Dica: Tente outro método de extração.")
                 continue
             
-            st.success(f'✅ Foram encontradas {len(tabelas)} tabelas!')
+            st.success(f'✅ Foram encontradas {resultado["encontradas"]} tabelas!')
+            
+            dados_excel = resultado['dados']
+            exportadas = resultado['exportadas']
+            tabelas_validas = len(exportadas)
             
-            # Criar Excel em memória
-            output = BytesIO()
             dfs_to_merge = []
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                tabelas_validas = 0
+            for i, df in exportadas:
+                # Guardar dataframe para mesclar depois
+                df_merge = df.copy()
+                df_merge.insert(0, 'Arquivo Origem', uploaded_file.name)
+                dfs_to_merge.append(df_merge)
                 
-                for i, df in enumerate(tabelas, 1):
-                    # Pular tabelas vazias ou muito pequenas
-                    if df.empty or len(df.columns) < 2:
-                        continue
-                    
-                    # Ajustar headers se solicitado
-                    if ajustar_headers:
-                        try:
-                            df = ajusta_header(df)
-                        except:
-                            pass
-                    
-                    # Converter EAN para número se existir
-                    if 'EAN' in df.columns:
-                        # Forçar conversão para números, erros viram NaN (que o Excel trata como vazio)
-                        # Mas se quiser manter zeros à esquerda, teria que ser string.
-                        # O usuário PEDIU para ser número.
-                        df['EAN'] = pd.to_numeric(df['EAN'], errors='coerce')
-
-                    # Guardar dataframe para mesclar depois
-                    df_merge = df.copy()
-                    df_merge.insert(0, 'Arquivo Origem', uploaded_file.name)
-                    dfs_to_merge.append(df_merge)
-
-                    # Escrever no Excel
-                    sheet_name = f'Tabela {i}'
-                    # Garantir que sheet_name não exceda 31 chars
-                    sheet_name = sheet_name[:31]
-                    
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    tabelas_validas += 1
-                    
-                    # Mostrar preview
-                    if mostrar_preview:
-                        with st.expander(f"📋 Tabela {i} - {len(df)} linhas x {len(df.columns)} colunas"):
-                            st.dataframe(df, use_container_width=True)
-            
-            output.seek(0)
+                # Mostrar preview
+                if mostrar_preview:
+                    with st.expander(f"📋 Tabela {i} - {len(df)} linhas x {len(df.columns)} colunas"):
+                        # O conteúdo do expander é renderizado mesmo fechado: a tabela só é
+                        # serializada para o navegador quando o usuário pede
+                        if st.toggle("Carregar prévia", key=f"preview_{uploaded_file.name}_{i}"):
+                            # Só as primeiras linhas vão para o navegador; o Excel tem a tabela completa
+                            st.dataframe(df.head(LINHAS_PREVIEW), use_container_width=True, hide_index=True)
+                            if len(df) > LINHAS_PREVIEW:
+                                st.caption(f"Mostrando {LINHAS_PREVIEW} de {len(df)} linhas")
             
             if tabelas_validas > 0:
                 # Armazenar resultado
                 resultados.append({
                     'nome': uploaded_file.name.replace('.pdf', ''),
-                    'dados': output.getvalue(),
                     'tabelas': tabelas_validas,
                     'dataframes': dfs_to_merge
                 })
+                if zip_file:
+                    zip_file.writestr(
+                        f"{uploaded_file.name.replace('.pdf', '')}_tabelas.xlsx",
+                        dados_excel
+                    )
                 
                 # Botão de download individual
                 col_a, col_b, col_c = st.columns([1, 2, 1])
                 with col_b:
                     st.download_button(
                         label=f"⬇️ Baixar {uploaded_file.name.replace('.pdf', '')}.xlsx",
-                        data=output.getvalue(),
+                        data=dados_excel,
                         file_name=f"{uploaded_file.name.replace('.pdf', '')}_tabelas.xlsx",
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                         use_container_width=True,
@@ -228,28 +328,19 @@ if uploaded_files:
             st.error(f"❌ Erro ao processar {uploaded_file.name}: {str(e)}")
         
         finally:
-            # Limpar arquivo temporário
-            if os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            # Soltar as referências deste arquivo antes do próximo (lotes grandes); a contagem
+            # de referências já libera o que não estiver em resultados/dfs_to_merge
+            future = resultado = dados_excel = exportadas = None
+    
+    if zip_file:
+        zip_file.close()
     
     # Botão para baixar todos os arquivos em ZIP (se houver mais de um)
     if len(resultados) > 1:
         st.divider()
         st.subheader("📦 Download em Lote")
         
-        # Criar ZIP com todos os arquivos
-        zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for resultado in resultados:
-                zip_file.writestr(
-                    f"{resultado['nome']}_tabelas.xlsx",
-                    resultado['dados']
-                )
-        
-        zip_buffer.seek(0)
+        dados_zip = zip_buffer.getvalue()
         
         # Mesclar dataframes
         excel_mesclado_buffer = BytesIO()
@@ -262,9 +353,11 @@ if uploaded_files:
         if todos_dfs:
             try:
                 df_mesclado = pd.concat(todos_dfs, ignore_index=True)
-                with pd.ExcelWriter(excel_mesclado_buffer, engine='openpyxl') as writer:
-                    df_mesclado.to_excel(writer, sheet_name='Pedidos Mesclados', index=False)
-                excel_mesclado_buffer.seek(0)
+                with pd.ExcelWriter(excel_mesclado_buffer, engine='xlsxwriter',
+                                    engine_kwargs={'options': {'constant_memory': True, 'strings_to_numbers': False}}) as writer:
+                    formato_header = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+                    escrever_aba(writer.book.add_worksheet('Pedidos Mesclados'), df_mesclado, formato_header)
+                dados_mesclado = excel_mesclado_buffer.getvalue()
                 has_merged = True
             except Exception as e:
                 st.error(f"Erro ao mesclar tabelas: {e}")
@@ -275,7 +368,7 @@ if uploaded_files:
             with col_x:
                 st.download_button(
                     label=f"📦 Baixar todos ({len(resultados)} arquivos) em ZIP",
-                    data=zip_buffer.getvalue(),
+                    data=dados_zip,
                     file_name="tabelas_convertidas.zip",
                     mime="application/zip",
                     use_container_width=True
@@ -283,7 +376,7 @@ if uploaded_files:
             with col_y:
                 st.download_button(
                     label=f"🔗 Mesclar todos em um único Excel",
-                    data=excel_mesclado_buffer.getvalue(),
+                    data=dados_mesclado,
                     file_name="todas_tabelas_mescladas.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     use_container_width=True
@@ -293,7 +386,7 @@ if uploaded_files:
             with col_y:
                 st.download_button(
                     label=f"📦 Baixar todos ({len(resultados)} arquivos) em ZIP",
-                    data=zip_buffer.getvalue(),
+                    data=dados_zip,
                     file_name="tabelas_convertidas.zip",
                     mime="application/zip",
                     use_container_width=True
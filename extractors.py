@@ -1,57 +1,198 @@
 import pandas as pd
+import numpy as np
 import pdfplumber
-import PyPDF2
 import re
 from io import BytesIO
-try:
-    from tabula import read_pdf
-    TABULA_AVAILABLE = True
-except ImportError:
-    TABULA_AVAILABLE = False
-import subprocess
+from importlib.util import find_spec
+# tabula (JPype) e PyPDF2 são importados só quando um extrator que os usa roda;
+# re2 (google-re2), se instalado, só compila as regexes de produto mais pesadas
+TABULA_AVAILABLE = find_spec('tabula') is not None
+RE2_AVAILABLE = find_spec('re2') is not None
+import shutil
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+
+@lru_cache(maxsize=None)
+def _java_disponivel():
+    """Look for a Java runtime on PATH once per process; the answer doesn't change between files.
+    Same answer as running 'java -version' (which only failed when the executable was missing),
+    without forking a process."""
+    return shutil.which('java') is not None
+
+def compilar_linear(padrao):
+    """Compila com o RE2 (autômato de tempo linear, sem backtracking) quando instalado e
+    o padrão é suportado por ele (lookarounds, por exemplo, não são); senão com o re.
+    Para os padrões cheios de .+? / .*? que rodam em toda linha."""
+    if RE2_AVAILABLE:
+        import re2
+        try:
+            return re2.compile(padrao)
+        except Exception:
+            pass
+    return re.compile(padrao)
 
 class PdfExtractor:
     """Base class for PDF extractors"""
     def extract(self, file_path):
         raise NotImplementedError("Subclasses must implement extract method")
 
+    def extract_bytes(self, data):
+        """Extract from PDF content already in memory (no temp file).
+        pdfplumber, PyPDF2 and tabula all accept a file-like object in place of a path."""
+        return self.extract(BytesIO(data))
+
+# Verdadeiro dentro de um worker de pool de arquivos: ali os PDFs já rodam um por processo,
+# e abrir mais um pool por PDF só multiplicaria processos (N arquivos x N faixas)
+_EM_POOL = False
+
+def marcar_worker_de_pool():
+    """Initializer dos pools que extraem um arquivo por processo: desliga o paralelismo
+    por faixa de páginas dentro do worker."""
+    global _EM_POOL
+    _EM_POOL = True
+
+def extrair_pdf(fabrica, data):
+    """Run an extractor over in-memory PDF bytes and return (tables, debug text).
+    Module-level so it can be shipped to a worker process (fabrica must be picklable:
+    an extractor class or a functools.partial over one)."""
+    extractor = fabrica()
+    tabelas = extractor.extract_bytes(data)
+    return tabelas, getattr(extractor, 'debug_text', '')
+
+def numeros_br(serie):
+    """Converte uma coluna de textos no formato BR ("1.234,56") para float de uma vez só:
+    remove pontos de milhar, troca a vírgula decimal por ponto; o que não converter vira 0.0."""
+    texto = serie.astype(str).str.replace('.', '', regex=False).str.replace(',', '.', regex=False)
+    # astype(float): uma coluna só de inteiros ("12", "1.000") viria int64 do to_numeric
+    return pd.to_numeric(texto, errors='coerce').fillna(0.0).astype(float)
+
+# Abaixo disso, subir processos (spawn + import do pdfplumber) custa mais que extrair em série
+MIN_PAGINAS_PARALELO = 8
+
+def _processar_faixa(origem, inicio, fim, funcao):
+    """Worker: abre o PDF por conta própria e aplica funcao às páginas [inicio, fim)."""
+    if isinstance(origem, bytes):
+        origem = BytesIO(origem)
+    with pdfplumber.open(origem) as pdf:
+        return [funcao(page) for page in pdf.pages[inicio:fim]]
+
+def _workers_para(num_paginas):
+    """Quantos processos usar para um PDF de num_paginas (1 = extrair em série)."""
+    if _EM_POOL:
+        return 1
+    workers = min(max(1, (os.cpu_count() or 1) - 1), num_paginas)
+    if num_paginas < MIN_PAGINAS_PARALELO or workers < 2:
+        return 1
+    return workers
+
+def _mapear_faixas(worker, file_path, num_paginas, workers, *args):
+    """Divide as páginas em faixas contíguas, uma por processo, e junta os resultados de
+    worker(origem, inicio, fim, *args) na ordem das páginas."""
+    # Cada worker reabre o PDF: em memória vão os bytes, do disco basta o caminho
+    origem = file_path.getvalue() if hasattr(file_path, 'getvalue') else file_path
+    tamanho = -(-num_paginas // workers)
+    inicios = range(0, num_paginas, tamanho)
+    fins = [min(inicio + tamanho, num_paginas) for inicio in inicios]
+    extras = [repeat(arg) for arg in args]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        faixas = pool.map(worker, repeat(origem), inicios, fins, *extras)
+        return [resultado for faixa in faixas for resultado in faixa]
+
+def processar_paginas(file_path, funcao):
+    """Aplica funcao(page) a cada página do PDF e devolve os resultados na ordem das páginas.
+    PDFs grandes são divididos em faixas contíguas, uma por processo; funcao precisa ser
+    picklable (função de módulo ou método de um extrator)."""
+    with pdfplumber.open(file_path) as pdf:
+        num_paginas = len(pdf.pages)
+        workers = _workers_para(num_paginas)
+        if workers == 1:
+            return [funcao(page) for page in pdf.pages]
+    return _mapear_faixas(_processar_faixa, file_path, num_paginas, workers, funcao)
+
+def _textos_pypdf2_faixa(origem, inicio, fim):
+    """Worker: abre o PDF com o PyPDF2 e extrai o texto das páginas [inicio, fim)."""
+    import PyPDF2
+    if isinstance(origem, bytes):
+        origem = BytesIO(origem)
+    reader = PyPDF2.PdfReader(origem)
+    return [reader.pages[i].extract_text() for i in range(inicio, fim)]
+
+def textos_pypdf2(file_path):
+    """Texto de cada página pelo PyPDF2, que é Python puro: PDFs grandes são extraídos
+    em faixas de páginas, uma por processo, como em processar_paginas."""
+    import PyPDF2
+    reader = PyPDF2.PdfReader(file_path)
+    num_paginas = len(reader.pages)
+    workers = _workers_para(num_paginas)
+    if workers == 1:
+        return [page.extract_text() for page in reader.pages]
+    return _mapear_faixas(_textos_pypdf2_faixa, file_path, num_paginas, workers)
+
+@lru_cache(maxsize=32)
+def _textos_em_cache(caminho, mtime_ns, tamanho):
+    # mtime_ns e tamanho só entram na chave: arquivo alterado em disco = nova leitura
+    return tuple(textos_pypdf2(caminho))
+
+def textos_do_arquivo(file_path):
+    """textos_pypdf2 com cache para caminhos em disco, pela identidade do arquivo
+    (caminho, mtime, tamanho). Arquivos em memória são lidos sempre; no app o cache já
+    fica em processar_arquivo, pelo conteúdo."""
+    if isinstance(file_path, (str, os.PathLike)):
+        info = os.stat(file_path)
+        return _textos_em_cache(os.fspath(file_path), info.st_mtime_ns, info.st_size)
+    return textos_pypdf2(file_path)
+
+def _tabelas_da_pagina(page):
+    # Página sem caracteres (digitalizada, só imagem) não tem tabela com conteúdo:
+    # pula a detecção de tabelas, que é a parte cara
+    if not page.chars:
+        return []
+    return page.extract_tables()
+
 class PdfPlumberExtractor(PdfExtractor):
     """Extract tables using pdfplumber"""
     def extract(self, file_path):
         tabelas = []
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for i, page in enumerate(pdf.pages, start=1):
-                    tables = page.extract_tables()
-                    for j, table in enumerate(tables, start=1):
-                        if table:
-                            # Clean table data
-                            cleaned_table = []
-                            for row in table:
-                                # Filter out None values and replace with empty string
-                                cleaned_row = [cell if cell is not None else "" for cell in row]
-                                # Only add rows that have at least one non-empty cell
-                                if any(str(c).strip() for c in cleaned_row):
-                                    cleaned_table.append(cleaned_row)
-                            
-                            if len(cleaned_table) > 1:
-                                df = pd.DataFrame(cleaned_table[1:], columns=cleaned_table[0])
-                                tabelas.append(df)
+            for i, tables in enumerate(processar_paginas(file_path, _tabelas_da_pagina), start=1):
+                for j, table in enumerate(tables, start=1):
+                    if table:
+                        # Clean table data
+                        cleaned_table = []
+                        for row in table:
+                            # Filter out None values and replace with empty string
+                            cleaned_row = [cell if cell is not None else "" for cell in row]
+                            # Only add rows that have at least one non-empty cell
+                            if any(str(c).strip() for c in cleaned_row):
+                                cleaned_table.append(cleaned_row)
+                        
+                        if len(cleaned_table) > 1:
+                            df = pd.DataFrame(cleaned_table[1:], columns=cleaned_table[0])
+                            tabelas.append(df)
         except Exception as e:
             print(f"Error in PdfPlumberExtractor: {e}")
         return tabelas
 
 class TabulaExtractor(PdfExtractor):
     """Extract tables using tabula-py"""
+    # Opções comuns a todas as leituras. java_options só valem na partida da JVM,
+    # que no modo jpype acontece uma vez por processo.
+    _OPCOES = dict(pages='all', silent=True, java_options=['-Xmx512m', '-Dfile.encoding=UTF-8'])
+
     def __init__(self, mode="lattice"):
         self.mode = mode # lattice, stream, or auto
 
     def check_java(self):
-        try:
-            subprocess.run(['java', '-version'], capture_output=True, text=True)
-            return True
-        except FileNotFoundError:
-            return False
+        return _java_disponivel()
+
+    def _ler(self, read_pdf, file_path, **modo):
+        # tabula copia o buffer a partir da posição atual: volta ao início a cada leitura
+        if hasattr(file_path, 'seek'):
+            file_path.seek(0)
+        return read_pdf(file_path, **self._OPCOES, **modo)
 
     def extract(self, file_path):
         if not self.check_java():
@@ -59,20 +200,22 @@ class TabulaExtractor(PdfExtractor):
             
         if not TABULA_AVAILABLE:
             raise ImportError("tabula-py not installed.")
+        from tabula import read_pdf
 
         tabelas = []
         try:
             if self.mode == "lattice":
-                tabelas = read_pdf(file_path, pages='all', lattice=True)
+                tabelas = self._ler(read_pdf, file_path, lattice=True)
             elif self.mode == "stream":
-                tabelas = read_pdf(file_path, pages='all', stream=True)
-            else: # auto
+                tabelas = self._ler(read_pdf, file_path, stream=True)
+            else: # auto: lattice primeiro; stream só se o lattice falhar ou vier vazio
                 try:
-                    tabelas = read_pdf(file_path, pages='all', lattice=True)
-                    if not tabelas or all(df.empty for df in tabelas):
-                        raise Exception("Empty lattice result")
-                except:
-                    tabelas = read_pdf(file_path, pages='all', stream=True)
+                    tabelas = self._ler(read_pdf, file_path, lattice=True)
+                except Exception as e:
+                    print(f"TabulaExtractor lattice failed, trying stream: {e}")
+                    tabelas = []
+                if not tabelas or all(df.empty for df in tabelas):
+                    tabelas = self._ler(read_pdf, file_path, stream=True)
         except Exception as e:
             print(f"Error in TabulaExtractor: {e}")
         
@@ -84,22 +227,140 @@ class TabulaExtractor(PdfExtractor):
 
 class TextExtractor(PdfExtractor):
     """Extract structured data from text using regex"""
+
+    # Rótulo de outro campo logo adiante na mesma linha, sem vírgula antes
+    # ("Fornecedor: 12 ACME CNPJ: ...", "Empresa: 1 LOJA Dt. Pedido: ...")
+    _PROXIMO_ROTULO = r'\s+(?:(?:CNPJ|Empresa|Forma|Frete)\b|Dt\.)'
+    # Todos os campos de cabeçalho numa única alternância: uma varredura por linha.
+    # Os textos livres (Fornecedor, Empresa) param antes do próximo rótulo, e os terminadores
+    # são lookaheads, para que o finditer não consuma o campo seguinte.
+    _RE_INFO = re.compile(
+        r'Dt\.\s*Pedido:\s*(?P<dt_pedido>[\d\/]+)'
+        r'|Dt\.\s*Entrega:\s*(?P<dt_entrega>[\d\/]+)'
+        r'|(?:Número do Pedido:|Pedido:)\s*(?P<pedido>\d+)'
+        r'|Fornecedor:\s*\d+\s*(?P<fornecedor>.+?)(?=,\s*CNPJ|' + _PROXIMO_ROTULO + r'|$)'
+        r'|CNPJ:\s*(?P<cnpj>[\d\.\/\-]+)'
+        r'|Empresa:\s*\d+\s*(?P<empresa>.+?)(?=,|' + _PROXIMO_ROTULO + r'|$)'
+        r'|Forma\s+Pgto:\s*(?P<forma_pgto>.+?)(?=,\s*Espécie|$)'
+        r'|Frete:\s*(?P<frete>\w+)'
+    )
+    # grupo da regex -> campo de saída, na ordem em que os campos eram preenchidos
+    _CAMPOS_INFO = (
+        ('pedido', 'Número do Pedido'),
+        ('fornecedor', 'Fornecedor'),
+        ('cnpj', 'CNPJ Fornecedor'),
+        ('empresa', 'Empresa'),
+        ('dt_pedido', 'Data Pedido'),
+        ('dt_entrega', 'Data Entrega'),
+        ('forma_pgto', 'Forma Pagamento'),
+        ('frete', 'Frete'),
+    )
+    _RE_SPLIT_COLUNAS = re.compile(r'\s{2,}')
+    # Fim da tabela de produtos
+    _RE_RODAPE = re.compile(r'recebimento|comprador|vendedor|obrigatório|---|pg:', re.IGNORECASE)
+    # Só dígitos, pontos e vírgulas (com ao menos um dígito): "1.234,56", "789123"
+    _RE_NUMERICO = re.compile(r'[.,]*\d[\d.,]*')
+    # Valor monetário: uma única vírgula (ou, sem vírgula, um único ponto) seguida de 2+ caracteres
+    _RE_VALOR = re.compile(r'[^,]*,[^,]{2,}|[^,.]*\.[^,.]{2,}')
+    # Número BR convertível: sinal opcional, pontos de milhar, no máximo uma vírgula decimal
+    # (espaços/pontos nas bordas somem no replace/float, então também são aceitos)
+    _RE_QUANTIDADE = re.compile(r'[\s.]*[+-]?(?=[\d.,]*\d)[\d.]*,?[\d.]*[\s.]*')
+    # Só espaços e invisíveis: NBSP, espaços finos/de largura fixa e U+3000 viram espaço
+    # comum; hífen opcional e largura zero somem. O resto (º, ª, ½, ligaduras) fica intacto
+    _TABELA_NORMALIZACAO = str.maketrans({
+        **dict.fromkeys(['\xa0', '\u202f', '\u205f', '\u3000', *map(chr, range(0x2000, 0x200b))], ' '),
+        **dict.fromkeys(['\xad', '\u200b', '\ufeff'], None),
+    })
+    _UNIDADES = frozenset({'CX', 'UN', 'PC', 'KG', 'LT'})
+    _COLUNAS_PRODUTO = (
+        'Código', 'Código Barras', 'Descrição', 'Marca', 'Quantidade',
+        'Preço Unitário', 'Valor Total', 'Embalagem'
+    )
+
     def extract(self, file_path):
         try:
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                texto_completo = ""
-                for page in reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        texto_completo += text + "\n"
+            # Texto do PyPDF2: a separação de colunas (2+ espaços) depende do espaçamento dele.
+            # Linhas acumuladas página a página, sem montar o texto inteiro numa string só
+            linhas = []
+            for text in textos_do_arquivo(file_path):
+                if text:
+                    linhas.extend(self._normalizar(text).split('\n'))
             
-            linhas = texto_completo.split('\n')
             return self._process_text(linhas)
         except Exception as e:
             print(f"Error in TextExtractor: {e}")
             return []
 
+    def _normalizar(self, texto):
+        """Troca NBSP e espaços Unicode por espaço comum e remove hífen opcional e caracteres
+        de largura zero, para que 'Dt. Pedido', 'Código' etc. casem como texto literal.
+        Sem NFKC: as descrições dos produtos vão para a planilha exatamente como no PDF."""
+        return texto.translate(self._TABELA_NORMALIZACAO)
+
+    def _eh_quantidade(self, parte):
+        """Número no formato BR menor que 10000, validado antes do float() (sem try/except)."""
+        if not self._RE_QUANTIDADE.fullmatch(parte):
+            return False
+        return float(parte.replace('.', '').replace(',', '.')) < 10000
+
+    def _casar_info(self, linha_limpa, info_geral):
+        """Preenche info_geral com os campos de cabeçalho encontrados na linha."""
+        achados = {}
+        for match in self._RE_INFO.finditer(linha_limpa):
+            # Vale a primeira ocorrência de cada campo na linha
+            achados.setdefault(match.lastgroup, match.group(match.lastgroup).strip())
+        if not achados:
+            return
+        
+        # Mesmas restrições de contexto de antes
+        if 'Fornecedor' not in linha_limpa:
+            achados.pop('cnpj', None)
+        if 'CNPJ' in linha_limpa:
+            achados.pop('empresa', None)
+        if 'Forma' in linha_limpa:
+            achados.pop('frete', None)
+        
+        for grupo, campo in self._CAMPOS_INFO:
+            if grupo in achados:
+                info_geral[campo] = achados[grupo]
+
+    def _parse_produto(self, partes):
+        """Classifica as colunas de uma linha da tabela de produtos.
+        Retorna a tupla na ordem de _COLUNAS_PRODUTO, ou None se quase nada foi reconhecido."""
+        # Uma única passada sobre as partes; cada parte pode alimentar mais de um
+        # campo (ex: "CX/12" é descrição e embalagem), como nas varreduras anteriores
+        codigo_barras = quantidade = embalagem = None
+        descricoes = []
+        valores = []
+        for parte in partes:
+            if codigo_barras is None and parte.isdigit() and len(parte) >= 12:
+                codigo_barras = parte
+            # Só as três primeiras descrições são usadas (Descrição + Marca)
+            if len(descricoes) < 3 and len(parte) > 3 and not self._RE_NUMERICO.fullmatch(parte):
+                descricoes.append(parte)
+            if ',' in parte or '.' in parte:
+                if quantidade is None and self._eh_quantidade(parte):
+                    quantidade = parte
+                if self._RE_VALOR.fullmatch(parte):
+                    valores.append(parte)
+            if embalagem is None and ('/' in parte or (len(parte) == 2 and parte.upper() in self._UNIDADES)):
+                embalagem = parte
+                
+        # Linha como tupla na ordem de _COLUNAS_PRODUTO; None = campo não encontrado
+        produto = (
+            partes[0] if partes[0].isdigit() else None,
+            codigo_barras,
+            ' '.join(descricoes[:2]) if descricoes else None,
+            descricoes[2] if len(descricoes) > 2 else None,
+            quantidade,
+            valores[0] if len(valores) >= 2 else None,
+            valores[-1] if len(valores) >= 2 else None,
+            embalagem,
+        )
+        if sum(campo is not None for campo in produto) >= 2:
+            return produto
+        return None
+
     def _process_text(self, linhas):
         # ... logic from extrair_texto_estruturado ...
         # Copied from original app.py and adapted
@@ -108,57 +369,44 @@ class TextExtractor(PdfExtractor):
             'Produtos': []
         }
         
-        # --- EXTRAÇÃO DE INFORMAÇÕES GERAIS ---
+        # Uma única passada pelas linhas: cabeçalho do pedido, tabela de produtos
+        # (do cabeçalho da tabela até o rodapé) e linhas genéricas para o fallback.
+        # As linhas genéricas só são guardadas enquanto nada estruturado apareceu;
+        # depois disso o fallback não será usado.
         info_geral = {}
-        for linha in linhas:
-            linha_limpa = linha.strip()
-            
-            # Número do Pedido
-            if 'Número do Pedido' in linha_limpa or 'Pedido:' in linha_limpa:
-                match = re.search(r'(?:Número do Pedido:|Pedido:)\s*(\d+)', linha_limpa)
-                if match:
-                    info_geral['Número do Pedido'] = match.group(1)
-            
-            # Fornecedor
-            if 'Fornecedor:' in linha_limpa:
-                match = re.search(r'Fornecedor:\s*\d+\s*(.+?)(?:,\s*CNPJ|$)', linha_limpa)
-                if match:
-                    info_geral['Fornecedor'] = match.group(1).strip()
-            
-            # CNPJ Fornecedor
-            if 'CNPJ:' in linha_limpa and 'Fornecedor' in linha_limpa:
-                match = re.search(r'CNPJ:\s*([\d\.\/\-]+)', linha_limpa)
-                if match:
-                    info_geral['CNPJ Fornecedor'] = match.group(1)
-            
-            # Empresa
-            if 'Empresa:' in linha_limpa and 'CNPJ' not in linha_limpa:
-                match = re.search(r'Empresa:\s*\d+\s*(.+?)(?:,|$)', linha_limpa)
-                if match:
-                    info_geral['Empresa'] = match.group(1).strip()
-            
-            # Datas
-            if 'Dt. Pedido' in linha_limpa:
-                match = re.search(r'Dt\.\s*Pedido:\s*([\d\/]+)', linha_limpa)
-                if match:
-                    info_geral['Data Pedido'] = match.group(1)
-            
-            if 'Dt. Entrega' in linha_limpa:
-                match = re.search(r'Dt\.\s*Entrega:\s*([\d\/]+)', linha_limpa)
-                if match:
-                    info_geral['Data Entrega'] = match.group(1)
-            
-            # Forma de Pagamento
-            if 'Forma Pgto' in linha_limpa or 'Forma de Pagamento' in linha_limpa:
-                match = re.search(r'Forma\s+Pgto:\s*(.+?)(?:,\s*Espécie|$)', linha_limpa)
-                if match:
-                    info_geral['Forma Pagamento'] = match.group(1).strip()
-            
-            # Frete
-            if 'Frete:' in linha_limpa and 'Forma' not in linha_limpa:
-                match = re.search(r'Frete:\s*(\w+)', linha_limpa)
-                if match:
-                    info_geral['Frete'] = match.group(1)
+        linhas_genericas = []
+        estado = 'ANTES_TABELA'  # -> 'TABELA' -> 'DEPOIS_TABELA'
+        # Strip feito uma vez só; linhas em branco não alimentam nenhum dos passos
+        linhas = [linha for linha in (linha.strip() for linha in linhas) if linha]
+        for linha_limpa in linhas:
+            
+            # --- INFORMAÇÕES GERAIS ---
+            # Todo campo de cabeçalho tem "rótulo:"; quando os oito já foram achados o casamento
+            # é pulado (o laço segue pelos produtos). Com isso vale o primeiro conjunto completo:
+            # um cabeçalho repetido mais adiante (ex: em outra página) não sobrescreve os valores
+            if len(info_geral) < len(self._CAMPOS_INFO) and ':' in linha_limpa:
+                self._casar_info(linha_limpa, info_geral)
+            
+            # --- PRODUTOS ---
+            if estado == 'ANTES_TABELA':
+                if 'Código' in linha_limpa and 'Descrição' in linha_limpa and ('Qtde' in linha_limpa or 'Quantidade' in linha_limpa):
+                    estado = 'TABELA'
+            elif estado == 'TABELA':
+                if self._RE_RODAPE.search(linha_limpa):
+                    estado = 'DEPOIS_TABELA'
+                elif len(linha_limpa) >= 10:
+                    partes = self._RE_SPLIT_COLUNAS.split(linha_limpa)
+                    if len(partes) >= 3:
+                        produto = self._parse_produto(partes)
+                        if produto:
+                            dados_pedido['Produtos'].append(produto)
+            
+            # --- LINHAS GENÉRICAS (fallback) ---
+            if linhas_genericas is not None:
+                if info_geral or dados_pedido['Produtos']:
+                    linhas_genericas = None
+                elif len(linha_limpa) >= 5:
+                    linhas_genericas.append(linha_limpa)
         
         if info_geral:
             for chave, valor in info_geral.items():
@@ -167,137 +415,114 @@ class TextExtractor(PdfExtractor):
                     'Valor': valor
                 })
         
-        # --- EXTRAÇÃO DE PRODUTOS ---
-        idx_header = -1
-        for i, linha in enumerate(linhas):
-            if 'Código' in linha and 'Descrição' in linha and ('Qtde' in linha or 'Quantidade' in linha):
-                idx_header = i
-                break
-        
-        if idx_header != -1:
-            for i in range(idx_header + 1, len(linhas)):
-                linha = linhas[i].strip()
-                if any(x in linha.lower() for x in ['recebimento', 'comprador', 'vendedor', 'obrigatório', '---', 'pg:']):
-                    break
-                if not linha or len(linha) < 10:
-                    continue
-                
-                partes = re.split(r'\s{2,}', linha)
-                if len(partes) >= 3:
-                    produto = {}
-                    if partes[0].isdigit():
-                        produto['Código'] = partes[0]
-                    for parte in partes:
-                        if parte.isdigit() and len(parte) >= 12:
-                            produto['Código Barras'] = parte
-                            break
-                    descricoes = [p for p in partes if not p.replace('.', '').replace(',', '').isdigit() and len(p) > 3]
-                    if descricoes:
-                        produto['Descrição'] = ' '.join(descricoes[:2])
-                        if len(descricoes) > 2:
-                            produto['Marca'] = descricoes[2]
-                    for parte in partes:
-                        if ',' in parte or '.' in parte:
-                            try:
-                                num_str = parte.replace('.', '').replace(',', '.')
-                                num = float(num_str)
-                                if num < 10000:
-                                    produto['Quantidade'] = parte
-                                    break
-                            except:
-                                pass
-                    valores = []
-                    for p in partes:
-                        if ',' in p or '.' in p:
-                            try:
-                                if ',' in p: partes_decimal = p.split(',')
-                                else: partes_decimal = p.split('.')
-                                if len(partes_decimal) == 2 and len(partes_decimal[1]) >= 2:
-                                    valores.append(p)
-                            except: pass
-                    if len(valores) >= 2:
-                        produto['Preço Unitário'] = valores[0]
-                        produto['Valor Total'] = valores[-1]
-                    for parte in partes:
-                        if '/' in parte or parte.upper() in ['CX', 'UN', 'PC', 'KG', 'LT']:
-                            produto['Embalagem'] = parte
-                            break
-                    if len(produto) >= 2:
-                        dados_pedido['Produtos'].append(produto)
-        
         dfs = []
         if dados_pedido['Informações Gerais']:
             dfs.append(pd.DataFrame(dados_pedido['Informações Gerais']))
         if dados_pedido['Produtos']:
-            dfs.append(pd.DataFrame(dados_pedido['Produtos']))
+            df_produtos = pd.DataFrame.from_records(dados_pedido['Produtos'], columns=self._COLUNAS_PRODUTO)
+            # Colunas que nenhuma linha preencheu ficam de fora, como no DataFrame a partir de dicts
+            dfs.append(df_produtos.dropna(axis=1, how='all'))
             
         if not dfs:
-             # Fallback logic for unstructured text
-            dados_genericos = []
-            for linha in linhas:
-                linha = linha.strip()
-                if not linha or len(linha) < 5: continue
-                campos = re.split(r'\s{2,}', linha)
-                if len(campos) >= 3:
-                    dados_genericos.append(campos)
-            
-            if dados_genericos and len(dados_genericos) > 1:
-                max_cols = max(len(row) for row in dados_genericos)
-                dados_padronizados = []
-                for row in dados_genericos:
-                    while len(row) < max_cols:
-                        row.append('')
-                    dados_padronizados.append(row[:max_cols])
-                
-                # Check duplicates in headers
-                headers = dados_padronizados[0]
-                if len(headers) != len(set(headers)):
-                     # Make headers unique
-                    counts = {}
-                    new_headers = []
-                    for h in headers:
-                        if h in counts:
-                            counts[h] += 1
-                            new_headers.append(f"{h}_{counts[h]}")
-                        else:
-                            counts[h] = 0
-                            new_headers.append(h)
-                    headers = new_headers
-
-                df = pd.DataFrame(dados_padronizados[1:], columns=headers)
+             # Fallback logic for unstructured text (linhas coletadas na passada acima)
+            df = self._tabela_generica(linhas_genericas) if linhas_genericas else None
+            if df is not None:
                 dfs.append(df)
             else:
-                dfs.append(pd.DataFrame({'Conteúdo': [l.strip() for l in linhas if l.strip()]}))
+                dfs.append(pd.DataFrame({'Conteúdo': linhas}))
                 
         return dfs
 
+    def _tabela_generica(self, linhas_genericas):
+        """Tabela a partir de linhas soltas, separando colunas por 2+ espaços.
+        O split vetorizado já devolve as linhas completadas até o maior número de colunas;
+        ficam só as linhas com pelo menos 3 campos. Retorna None se sobrar menos de 2 linhas."""
+        df = pd.Series(linhas_genericas).str.split(self._RE_SPLIT_COLUNAS, expand=True)
+        df = df.dropna(thresh=3).fillna('')
+        if len(df) <= 1:
+            return None
+        
+        # Primeira linha vira cabeçalho; nomes repetidos ganham sufixo _1, _2...
+        # (cumcount numera cada ocorrência dentro do grupo de nomes iguais)
+        headers = df.iloc[0].reset_index(drop=True)
+        ocorrencia = headers.groupby(headers).cumcount()
+        if ocorrencia.any():
+            headers = headers.where(ocorrencia == 0, headers + '_' + ocorrencia.astype(str))
+        
+        df = df.iloc[1:].reset_index(drop=True)
+        df.columns = headers.tolist()
+        return df
+
 class RedeBizExtractor(PdfExtractor):
     """Extract structured data from REDE BIZ purchase orders (TOTVS format)"""
+
+    _RE_PEDIDO         = re.compile(r'PEDIDO DE COMPRAS\s+(\S+)')
+    _RE_FORNECEDOR     = re.compile(r'REDE BIZ SERVICOS E DISTRIBUICAO DE PRO')
+    _RE_CLIENTE        = re.compile(r'R\. Social SUPERMERCADO JB[^\n]*?LTDA')
+    _RE_CNPJ_INVERTIDO = re.compile(r'CNPJ\s+([-\d]{2,4})\s+([\d\.\/]{10,18})')
+    _RE_CNPJ           = re.compile(r'CNPJ\s+([\d\.\-\/]+)')
+    _RE_DECIMAL        = re.compile(r'\d+,\d+')
+    _RE_PRODUTO        = compilar_linear(r'(\d+)\s+(?:[\d,]+\s+){4}([\d\.,]+)\s+([\d\.,]+)\s+([\d\.,]+)\s+([A-Z]{2})\s+(\d+)\s+(.+)')
+    _RE_EANS           = re.compile(r'EANs:\s*([\d,\s]+)')
+    _RE_TEM_EMBALAGEM  = re.compile(r'\s[A-Z]{2}\s')
+    # Palavras-chave dos campos simples: uma busca só decide se a linha tem cabeçalho
+    _RE_TEM_CABECALHO  = re.compile(r'Data limite para entrega|o do frete|Data da emiss|Valor total do pedido')
+    # Campos simples do cabeçalho numa regex só: cada alternativa é um lookahead com
+    # grupo nomeado, então campos na mesma linha não se consomem uns aos outros
+    _RE_CABECALHO = re.compile(
+        r'(?=Data limite para entrega\s+(?P<data_limite>[\d\/]+))'
+        r'|(?=o do frete\s+(?P<frete>\w+))'
+        r'|(?=Data da emiss.+?\s+(?P<emissao>[\d\/]+))'
+        r'|(?=Valor total do pedido\s+(?P<valor_total>[\d\.,]+))'
+    )
+    # grupo da regex -> campo do pedido
+    _CAMPOS_CABECALHO = {
+        'data_limite': 'Data Limite Entrega',
+        'frete': 'Condição Frete',
+        'emissao': 'Data Emissão',
+        'valor_total': 'Valor Total',
+    }
+    _COLUNAS_PEDIDO = (
+        'Número do Pedido', 'Fornecedor', 'CNPJ Fornecedor', 'Cliente', 'CNPJ Cliente',
+        'Endereço Entrega', 'Cidade Entrega', 'Data Limite Entrega', 'Condição Frete',
+        'Data Emissão', 'Valor Total'
+    )
+    _COLUNAS_PRODUTO = (
+        'Número do Pedido', 'Código Fornecedor', 'Descrição', 'Quantidade', 'Embalagem',
+        'Valor Unit.', 'Valor Total', 'Qtde CX', 'EAN'
+    )
     
     def extract(self, file_path):
         try:
-            # Extract all text from PDF
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                texto_completo = ""
-                for page in reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        texto_completo += text + "\n"
-            
-            linhas = texto_completo.split('\n')
-            return self._process_redebiz_text(linhas)
+            # Extract all text from PDF (PyPDF2, páginas em cache por arquivo)
+            return self._process_redebiz_text(self._linhas(textos_do_arquivo(file_path)))
         except Exception as e:
             print(f"Error in RedeBizExtractor: {e}")
             return []
     
+    def extract_from_text(self, texto):
+        """Processa um texto já extraído do PDF (ex: o dump do reproduce_totvs), sem
+        reabrir o arquivo."""
+        return self._process_redebiz_text(texto.split('\n'))
+    
+    def _linhas(self, textos):
+        """Linhas de todas as páginas, acumuladas página a página sem concatenar o texto
+        numa string crescente."""
+        linhas = []
+        for text in textos:
+            if text:
+                linhas.extend(text.split('\n'))
+        return linhas
+    
     def _process_redebiz_text(self, linhas):
         """Process REDE BIZ TOTVS purchase order format"""
-        pedidos = []
-        produtos_list = []
+        # Colunas acumuladas como listas (uma por campo); o registro corrente é sempre
+        # o último de cada lista, então os campos do cabeçalho são preenchidos com [-1]
+        pedidos = {col: [] for col in self._COLUNAS_PEDIDO}
+        produtos = {col: [] for col in self._COLUNAS_PRODUTO}
         
-        current_pedido = None
-        current_produto = None
+        tem_pedido = False
+        tem_produto = False
         in_produtos_section = False
         
         for i, linha in enumerate(linhas):
@@ -306,102 +531,66 @@ class RedeBizExtractor(PdfExtractor):
             # Detectar início de novo pedido
             if 'PEDIDO DE COMPRAS' in linha_limpa:
                 # Extrair número do pedido
-                match = re.search(r'PEDIDO DE COMPRAS\s+(\S+)', linha_limpa)
+                match = self._RE_PEDIDO.search(linha_limpa)
                 numero_pedido = match.group(1) if match else ''
                 
-                # Verificar se é realmente um NOVO pedido (número diferente)
-                if current_pedido and current_pedido['Número do Pedido'] != numero_pedido:
-                    # Salvar pedido anterior apenas se o número for diferente
-                    pedidos.append(current_pedido)
-                    
-                    # Criar novo pedido
-                    current_pedido = {
-                        'Número do Pedido': numero_pedido,
-                        'Fornecedor': '',
-                        'CNPJ Fornecedor': '',
-                        'Cliente': '',
-                        'CNPJ Cliente': '',
-                        'Endereço Entrega': '',
-                        'Cidade Entrega': '',
-                        'Data Limite Entrega': '',
-                        'Condição Frete': '',
-                        'Data Emissão': '',
-                        'Valor Total': ''
-                    }
-                    in_produtos_section = False
-                elif not current_pedido:
-                    # Primeiro pedido do documento
-                    current_pedido = {
-                        'Número do Pedido': numero_pedido,
-                        'Fornecedor': '',
-                        'CNPJ Fornecedor': '',
-                        'Cliente': '',
-                        'CNPJ Cliente': '',
-                        'Endereço Entrega': '',
-                        'Cidade Entrega': '',
-                        'Data Limite Entrega': '',
-                        'Condição Frete': '',
-                        'Data Emissão': '',
-                        'Valor Total': ''
-                    }
+                # Novo pedido: o primeiro do documento ou um número diferente do atual
+                # (mesmo número = mesma página ou continuação)
+                if not tem_pedido or pedidos['Número do Pedido'][-1] != numero_pedido:
+                    for col, valores in pedidos.items():
+                        valores.append(numero_pedido if col == 'Número do Pedido' else '')
+                    tem_pedido = True
                     in_produtos_section = False
                 # Se for o mesmo pedido (mesma página ou continuação), apenas continua processando
                 continue
             
-            if not current_pedido:
+            if not tem_pedido:
                 continue
             
             # Extrair informações do cabeçalho
             if 'R. Social' in linha_limpa and 'REDE BIZ' in linha_limpa:
                 # Fornecedor
-                match = re.search(r'REDE BIZ SERVICOS E DISTRIBUICAO DE PRO', linha_limpa)
+                match = self._RE_FORNECEDOR.search(linha_limpa)
                 if match:
-                    current_pedido['Fornecedor'] = 'REDE BIZ SERVICOS E DISTRIBUICAO'
+                    pedidos['Fornecedor'][-1] = 'REDE BIZ SERVICOS E DISTRIBUICAO'
                 
                 # Cliente
-                match = re.search(r'R\. Social SUPERMERCADO JB[^\n]*?LTDA', linha_limpa)
+                match = self._RE_CLIENTE.search(linha_limpa)
                 if match:
-                    current_pedido['Cliente'] = match.group(0).replace('R. Social ', '')
+                    pedidos['Cliente'][-1] = match.group(0).replace('R. Social ', '')
             
             if 'CNPJ' in linha_limpa and 'REDE BIZ' not in linha_limpa:
                 # CNPJ do Cliente (formato invertido no PDF: "CNPJ -27 18.510.982/0001")
                 # Padrão: "CNPJ", espaço, sufixo (ex: -27), espaço, corpo (ex: 18...)
-                match = re.search(r'CNPJ\s+([-\d]{2,4})\s+([\d\.\/]{10,18})', linha_limpa)
+                match = self._RE_CNPJ_INVERTIDO.search(linha_limpa)
                 if match:
                     # Formato encontrado: sufixo (grupo 1) e corpo (grupo 2)
                     # Montar na ordem correta: corpo + sufixo
-                    current_pedido['CNPJ Cliente'] = match.group(2) + match.group(1)
+                    pedidos['CNPJ Cliente'][-1] = match.group(2) + match.group(1)
                 else:
                     # Tenta formato normal se o específico não der match
-                    match = re.search(r'CNPJ\s+([\d\.\-\/]+)', linha_limpa)
+                    match = self._RE_CNPJ.search(linha_limpa)
                     if match:
-                        current_pedido['CNPJ Cliente'] = match.group(1)
+                        pedidos['CNPJ Cliente'][-1] = match.group(1)
             
             if 'CNPJ' in linha_limpa and 'REDE BIZ' in linha_limpa:
                 # CNPJ do Fornecedor
-                match = re.search(r'CNPJ\s+([\d\.\-\/]+)', linha_limpa)
-                if match:
-                    current_pedido['CNPJ Fornecedor'] = match.group(1)
-            
-            if 'Data limite para entrega' in linha_limpa:
-                match = re.search(r'Data limite para entrega\s+([\d\/]+)', linha_limpa)
-                if match:
-                    current_pedido['Data Limite Entrega'] = match.group(1)
-            
-            if 'Condi' in linha_limpa and 'o do frete' in linha_limpa:
-                match = re.search(r'o do frete\s+(\w+)', linha_limpa)
-                if match:
-                    current_pedido['Condição Frete'] = match.group(1)
-            
-            if 'Data da emiss' in linha_limpa:
-                match = re.search(r'Data da emiss.+?\s+([\d\/]+)', linha_limpa)
-                if match:
-                    current_pedido['Data Emissão'] = match.group(1)
-            
-            if 'Valor total do pedido' in linha_limpa:
-                match = re.search(r'Valor total do pedido\s+([\d\.,]+)', linha_limpa)
+                match = self._RE_CNPJ.search(linha_limpa)
                 if match:
-                    current_pedido['Valor Total'] = match.group(1)
+                    pedidos['CNPJ Fornecedor'][-1] = match.group(1)
+            
+            # Campos simples do cabeçalho: linhas sem nenhuma palavra-chave (a maioria) saem
+            # com uma busca; as demais são varridas uma vez, despachando pelo grupo casado
+            if self._RE_TEM_CABECALHO.search(linha_limpa):
+                achados = {}
+                for match in self._RE_CABECALHO.finditer(linha_limpa):
+                    # Vale a primeira ocorrência de cada campo na linha
+                    achados.setdefault(match.lastgroup, match.group(match.lastgroup))
+                # O frete só vale com o 'Condi' de "Condição" na linha (o acento pode vir quebrado)
+                if 'frete' in achados and 'Condi' not in linha_limpa:
+                    del achados['frete']
+                for grupo, valor in achados.items():
+                    pedidos[self._CAMPOS_CABECALHO[grupo]][-1] = valor
             
             # Detectar início da seção de produtos
             if 'Cod Forn' in linha_limpa and 'Seq' in linha_limpa and 'Produtos' in linha_limpa:
@@ -411,14 +600,12 @@ class RedeBizExtractor(PdfExtractor):
             # Detectar fim da seção de produtos
             # Só considera fim se tiver substantivos além de "TOTAIS" ou se for claramente fim
             if in_produtos_section:
-                if ('TOTAIS' in linha_limpa and re.search(r'\d+,\d+', linha_limpa)) or \
+                if ('TOTAIS' in linha_limpa and self._RE_DECIMAL.search(linha_limpa)) or \
                    ('DADOS ADICIONAIS' in linha_limpa) or \
                    ('ADVERT' in linha_limpa):
-                    # Salvar último produto antes de fechar seção
-                    if current_produto and current_produto.get('Código Fornecedor'):
-                        produtos_list.append(current_produto.copy())
+                    # Fechar seção (o último produto já está nas listas)
                     in_produtos_section = False
-                    current_produto = None
+                    tem_produto = False
                     continue
 
                 # Processar linhas de produtos dentro da seção
@@ -435,13 +622,14 @@ class RedeBizExtractor(PdfExtractor):
                 # Regex simplificado focado nos campos finais que são consistentes
                 # Codigo Fornecedor está no inicio da sequencia de numeros importantes
                 # 504251 0,00 ...
-                match_prod = re.search(r'(\d+)\s+(?:[\d,]+\s+){4}([\d\.,]+)\s+([\d\.,]+)\s+([\d\.,]+)\s+([A-Z]{2})\s+(\d+)\s+(.+)', linha_limpa)
+                # Pré-filtro: sem uma embalagem de 2 letras entre espaços a regex de produto
+                # não casa, e em linhas só de números ela é muito mais cara para falhar
+                match_prod = None
+                if self._RE_TEM_EMBALAGEM.search(linha_limpa):
+                    match_prod = self._RE_PRODUTO.search(linha_limpa)
                 
                 if match_prod:
-                    # Encontrou linha de produto -> Salvar anterior se existir
-                    if current_produto and current_produto.get('Código Fornecedor'):
-                        produtos_list.append(current_produto.copy())
-                    
+                    # Encontrou linha de produto -> nova linha nas listas de produtos
                     cod_forn = match_prod.group(1)
                     val_total = match_prod.group(2)
                     val_unit = match_prod.group(3)
@@ -456,62 +644,43 @@ class RedeBizExtractor(PdfExtractor):
                     # No exemplo: 504251 (Forn) ... Desc ... 23959. São diferentes.
                     # Vou manter na descrição.
                     
-                    current_produto = {
-                        'Número do Pedido': current_pedido['Número do Pedido'],
-                        'Código Fornecedor': cod_forn,
-                        'Descrição': descricao,
-                        'Quantidade': qtde,
-                        'Embalagem': emb,
-                        'Valor Unit.': val_unit,
-                        'Valor Total': val_total,
-                        'Qtde CX': seq,
-                        'EAN': '' # Será preenchido na proxima linha se houver
-                    }
+                    linha_produto = (
+                        pedidos['Número do Pedido'][-1], cod_forn, descricao, qtde, emb,
+                        val_unit, val_total, seq,
+                        ''  # EAN: será preenchido na proxima linha se houver
+                    )
+                    for valores, valor in zip(produtos.values(), linha_produto):
+                        valores.append(valor)
+                    tem_produto = True
                     continue
                 
                 # 2. Tentar capturar linha de EAN
                 # Ex: EANs: 7891024184271
-                if 'EANs:' in linha_limpa and current_produto:
-                    match_ean = re.search(r'EANs:\s*([\d,\s]+)', linha_limpa)
+                if 'EANs:' in linha_limpa and tem_produto:
+                    match_ean = self._RE_EANS.search(linha_limpa)
                     if match_ean:
                         eans = match_ean.group(1).replace(' ', '')
                         # Se tiver virgula, pega o primeiro ou todos? O pandas vai tratar string.
-                        current_produto['EAN'] = eans
+                        produtos['EAN'][-1] = eans
                     continue
         
-        # Salvar último pedido e produto
-        if current_produto and current_produto.get('Código Fornecedor'):
-            produtos_list.append(current_produto)
-        if current_pedido:
-            pedidos.append(current_pedido)
-        
-        # Criar DataFrames
+        # Criar DataFrames direto das colunas
         dfs = []
         
-        if pedidos:
+        if pedidos['Número do Pedido']:
             df_pedidos = pd.DataFrame(pedidos)
             dfs.append(df_pedidos)
         
-        if produtos_list:
-            df_produtos = pd.DataFrame(produtos_list)
+        if produtos['Código Fornecedor']:
+            df_produtos = pd.DataFrame(produtos)
             
             # Converter colunas numéricas para formato nativo (para o Excel reconhecer como número)
             if not df_produtos.empty:
-                def conv_num(val):
-                    if isinstance(val, str):
-                        # Remove pontos de milhar e troca vírgula decimal por ponto
-                        val_clean = val.replace('.', '').replace(',', '.')
-                        try:
-                            return float(val_clean)
-                        except ValueError:
-                            return 0.0
-                    return val
-
                 # Aplicar conversão em colunas de valores (float)
                 cols_valor = ['Quantidade', 'Valor Unit.', 'Valor Total']
                 for col in cols_valor:
                     if col in df_produtos.columns:
-                        df_produtos[col] = df_produtos[col].apply(conv_num)
+                        df_produtos[col] = numeros_br(df_produtos[col])
                 
                 # Converter Identificadores para inteiro
                 cols_int = ['Código Fornecedor', 'EAN', 'Qtde CX']
@@ -529,6 +698,74 @@ class RedeBizExtractor(PdfExtractor):
 
 class MondelezExtractor(PdfExtractor):
     """Extrator específico para pedidos Mondelez - Bebidas (Layout Rede BIZ)"""
+
+    _RE_NAO_VALOR = re.compile(r'[^\d,\s]')
+    # Padrões de _process_text
+    _RE_PEDIDO         = re.compile(r'(?:PEDIDO DE COMPRAS|Número do Pedido|Pedido|Nº|Numero)[:\s]+(\d+)', re.IGNORECASE)
+    _RE_RAZAO_SOCIAL   = re.compile(r'R\. Social\s+(.+)')
+    _RE_CNPJ           = re.compile(r'(\d{2}\.\d{3}\.\d{3}\/\d{4}-\d{2})')
+    _RE_CNPJ_INVERTIDO = re.compile(r'CNPJ\s+-(\d{2})\s+([\d\.\/]+)')
+    _RE_SMART          = compilar_linear(r'^\s*(\d+)\s+(?:(\d+)\s+)?(.+?)\s+(\d+)\s+((?:UN|CX|PC|KG|LT)(?:\s+\d+)?).*?(\d+,\d+)\s+[\d,\.]+\s+([\d,\.]+)$')
+    _RE_FORMATO_B      = compilar_linear(r'^(\d{6})\s+.*?\s+([\d\.,]+)\s+([\d\.,]+)\s+([\d\.,]+)\s+((?:UN|CX|PC|KG|LT)(?:\s+\d+)?)\s+(\d+)\s+(.+)$')
+    _RE_EANS           = re.compile(r'EANs?:\s*([\d,\s]+)')
+    _RE_TEM_EMBALAGEM  = re.compile(r'\s(?:UN|CX|PC|KG|LT)')
+    _RE_TEM_CABECALHO  = re.compile(
+        r'R\. Social|CNPJ|Data limite para entrega|Condição do frete|Data da emissão|Valor total do pedido'
+    )
+    # Campos simples do cabeçalho numa única alternância. Cada ramo é um lookahead: nada é
+    # consumido, então um campo que vai até o fim da linha (frete) não esconde os seguintes
+    _RE_CABECALHO = re.compile(
+        r'(?=Data limite para entrega\s+(?P<data_limite>[\d\/]+))'
+        r'|(?=Condição do frete\s+(?P<frete>.+))'
+        r'|(?=Data da emissão\s+(?P<emissao>[\d\/]+))'
+        r'|(?=Valor total do pedido\s+(?P<valor_total>[\d\.,]+))'
+    )
+    # grupo da regex -> campo do pedido
+    _CAMPOS_CABECALHO = {
+        'data_limite': 'Data Limite Entrega',
+        'frete': 'Condição Frete',
+        'emissao': 'Data Emissão',
+        'valor_total': 'Valor Total',
+    }
+    # Continuação de descrição: rodapés (comparados com a linha em maiúsculas)
+    # e campos de endereço/cadastro não entram na descrição do produto
+    _BLOQUEADOS = (
+        "DADOS", "TOTAL", "PÁGINA", "PAGINA", "SUPERUS", "COD/NOME", "CODIGO FORNECEDOR",
+        "QUANTIDADE DE PEÇAS", "DATA DE ENTREGA", "PRAZO", "E-MAIL", "FRETE",
+        "TRANSPORTADORA", "DATA DE VENCIMENTO", "TIPO DE TROCA"
+    )
+    _IGNORADOS = ('Bairro', 'Cidade', 'CNPJ', 'Endereço', 'Telefone', 'Inscrição', 'Pedido')
+    _RE_BLOQUEADOS = re.compile('|'.join(map(re.escape, _BLOQUEADOS)))
+    _RE_IGNORADOS = re.compile('|'.join(map(re.escape, _IGNORADOS)))
+    _COLUNAS_PEDIDO = (
+        'Número do Pedido', 'Fornecedor', 'CNPJ Fornecedor', 'Cliente', 'CNPJ Cliente',
+        'Endereço Entrega', 'Cidade Entrega', 'Data Limite Entrega', 'Condição Frete',
+        'Data Emissão', 'Valor Total'
+    )
+    _COLUNAS_PRODUTO = (
+        'Número do Pedido', 'Código Fornecedor', 'Valor Unit.', 'Quantidade', 'Embalagem',
+        'Sequência', 'Descrição', 'EAN'
+    )
+    # Tokens de _clean_garbled_line: embalagem (com a quantidade opcional),
+    # palavra em maiúsculas com 3+ letras ou sequência de dígitos
+    _RE_TOKENS = re.compile(
+        r'(?P<emb>\b(?P<tipo_emb>CX|UN|PC|KG|LT)(?:\s+(?P<qtd_emb>\d+))?\b)'
+        r'|(?P<palavra>\b[A-Z]{3,}\b)'
+        r'|(?P<num>\d+)'
+    )
+    # Termos que DETONAM o resto da linha (rodapés e cabeçalhos colados aos dados)
+    _TERMOS_CORTE = (
+        "DADOS DO COD", "DADOS DO CÓD", "DADOS COMERCIAIS",
+        "DADOS PARA FATURAMENTO", "RAZÃO SOCIAL:", "RAZAO SOCIAL:",
+        "SUPERUS", "PÁGINA:", "PAGINA:", "COD/NOME", "COD/ NOME", "DADOS DO"
+    )
+    _RE_TERMOS_CORTE = re.compile('|'.join(map(re.escape, _TERMOS_CORTE)), re.IGNORECASE)
+    # Gatilhos que também encerram a linha (datas, fornecedores etc)
+    _RE_GATILHOS = re.compile(
+        r'Usuário:|Emissão:|Fornecedor:|Substituição|Data Entrega:|Data Fat:'
+        r'|Número de Registros|Valor Total|Vendedor|Comprador|Direção',
+        re.IGNORECASE
+    )
     
     def __init__(self):
         self.debug_text = ""
@@ -539,27 +776,30 @@ class MondelezExtractor(PdfExtractor):
         Exemplo: '7C8o9d60ig3o6001165 1R40e3f4 F2orn EXTRATO...'
         Estratégia: Remover letras para extrair números limpos, depois reconstruir.
         """
-        # Extrair descrição PRIMEIRO (palavras em maiúsculas com 3+ letras)
-        desc_words = re.findall(r'\b[A-Z]{3,}\b', linha)
+        # Uma única varredura da linha: embalagem (ex: CX 144, UN), palavras em maiúsculas
+        # com 3+ letras (descrição) e sequências de dígitos, na ordem em que aparecem
+        desc_words = []
+        numbers = []
+        emb_tipo = emb_qtd = None
+        for token in self._RE_TOKENS.finditer(linha):
+            if token['num'] is not None:
+                numbers.append(token['num'])
+            elif token['palavra'] is not None:
+                desc_words.append(token['palavra'])
+            else:
+                # Os dígitos da embalagem também contam como número
+                if token['qtd_emb'] is not None:
+                    numbers.append(token['qtd_emb'])
+                if emb_tipo is None:
+                    emb_tipo, emb_qtd = token['tipo_emb'], token['qtd_emb']
         desc = ' '.join(desc_words) if desc_words else ''
         
-        # Tentar extrair embalagem (ex: CX 144, UN, etc)
-        # Procura por CX, UN, PC, KG, LT seguidos ou não de número
-        emb_match = re.search(r'\b(CX|UN|PC|KG|LT)(?:\s+(\d+))?\b', linha)
         emb_str = "UN" # Default
-        if emb_match:
-            tipo = emb_match.group(1)
-            qtd_emb = emb_match.group(2)
-            if qtd_emb:
-                emb_str = f"{tipo} {qtd_emb}"
+        if emb_tipo:
+            if emb_qtd:
+                emb_str = f"{emb_tipo} {emb_qtd}"
             else:
-                emb_str = tipo
-        
-        # Remover TODAS as letras (exceto da descrição que já salvamos)
-        only_digits_and_spaces = re.sub(r'[a-zA-Z\.]', ' ', linha)
-        
-        # Extrair todas as sequências numéricas
-        numbers = re.findall(r'\d+', only_digits_and_spaces)
+                emb_str = emb_tipo
         
         # Identificar componentes pelos tamanhos típicos
         ean = ''
@@ -572,7 +812,7 @@ class MondelezExtractor(PdfExtractor):
                 ean = num
             elif len(num) == 6 and not code:  # Código tem 6 dígitos
                 code = num
-            elif len(num) == 2 and not qty and num != emb_match.group(2) if emb_match and emb_match.group(2) else True:  
+            elif len(num) == 2 and not qty and num != emb_qtd if emb_qtd else True:  
                 # Quantidade 2 dígitos (48). Cuidado para não pegar o 144 da caixa como quantidade
                 qty = num
             elif len(num) == 1 and not qty and int(num) > 0: # Qtde pode ser 1 dígito (ex: 6 UN)
@@ -581,11 +821,10 @@ class MondelezExtractor(PdfExtractor):
         # Valores monetários: buscar manualmente se o regex falhou
         if ',' in linha:
             # Padrão mais flexível para valores "escondidos" tipo "6,40" dentro de "U6ni,t40"
-            # Remove letras e mantem digitos e virgulas
-            nums_commas = re.sub(r'[a-zA-Z]', '', linha).split()
+            # Em cada trecho da linha mantem só digitos e virgulas: uma única substituição
+            # na linha inteira (preservando os espaços) e depois o split nos trechos
             potential_values = []
-            for item in nums_commas:
-                 clean_item = re.sub(r'[^\d,]', '', item) # limpa sujeira extra
+            for clean_item in self._RE_NAO_VALOR.sub('', linha).split(): # limpa letras e sujeira extra
                  if ',' in clean_item and len(clean_item) > 3: # min 0,00
                      potential_values.append(clean_item)
             if potential_values:
@@ -616,44 +855,42 @@ class MondelezExtractor(PdfExtractor):
         Usa um algoritmo de clusterização para evitar misturar linhas próximas.
         """
         try:
+            # Página sem caracteres (digitalizada): nada para agrupar em linhas
+            if not page.chars:
+                return ""
             words = page.extract_words(x_tolerance=1, y_tolerance=1)
             if not words:
                 return ""
             
-            # Ordenar palavras pela posição vertical (top)
-            words = sorted(words, key=lambda w: w['top'])
-            
-            lines = []
-            current_line = []
-            current_top = words[0]['top']
+            # Coordenadas em arrays (uma passada pelos dicts); ordem vertical estável
+            tops = np.fromiter((w['top'] for w in words), dtype=float, count=len(words))
+            x0s = np.fromiter((w['x0'] for w in words), dtype=float, count=len(words))
+            ordem = np.argsort(tops, kind='stable')
+            tops_ordenados = tops[ordem]
             
             # Tolerância vertical para considerar mesma linha (ajustável)
             # 1.5 evita misturar cabeçalhos de tabela com dados quando estão muito próximos
             y_tolerance = 1.5 
             
-            for word in words:
-                # Se a palavra está próxima o suficiente da linha atual (verticalmente)
-                if abs(word['top'] - current_top) <= y_tolerance:
-                    current_line.append(word)
-                else:
-                    # Nova linha detectada
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = [word]
-                    current_top = word['top']
+            # Uma linha começa numa palavra e vai até a última cujo top está a no máximo
+            # y_tolerance dela; a busca binária salta direto para o início da próxima linha
+            inicios = []
+            inicio = 0
+            while inicio < len(words):
+                inicios.append(inicio)
+                inicio = int(np.searchsorted(tops_ordenados, tops_ordenados[inicio] + y_tolerance, side='right'))
             
-            # Adicionar a última linha
-            if current_line:
-                lines.append(current_line)
+            # Id da linha de cada palavra; dentro da linha, ordem horizontal (lexsort é estável)
+            tamanhos = np.diff(np.append(inicios, len(words)))
+            ids_linha = np.repeat(np.arange(len(inicios)), tamanhos)
+            ordem = ordem[np.lexsort((x0s[ordem], ids_linha))]
             
             # Construir o texto final
             text_lines = []
-            for line in lines:
-                # Ordenar palavras horizontalmente dentro da linha
-                line_words = sorted(line, key=lambda w: w['x0'])
-                # Juntar palavras
-                line_str = ' '.join([w['text'] for w in line_words])
-                text_lines.append(line_str)
+            fim = 0
+            for tamanho in tamanhos:
+                inicio, fim = fim, fim + tamanho
+                text_lines.append(' '.join(words[k]['text'] for k in ordem[inicio:fim]))
                 
             return '\n'.join(text_lines)
         except Exception as e:
@@ -663,13 +900,13 @@ class MondelezExtractor(PdfExtractor):
     def extract(self, file_path):
         try:
             # Usar extração customizada baseada em coordenadas
-            texto_completo = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text = self._extract_text_custom(page)
-                    if text:
-                        # Adicionar marcador de página para debug se necessário
-                        texto_completo += text + "\n"
+            # Textos das páginas numa lista, unidos uma vez só no final
+            partes = []
+            for text in processar_paginas(file_path, self._extract_text_custom):
+                if text:
+                    # Adicionar marcador de página para debug se necessário
+                    partes.append(text)
+            texto_completo = '\n'.join(partes)
             
             self.debug_text = texto_completo
             linhas = texto_completo.split('\n')
@@ -688,39 +925,23 @@ class MondelezExtractor(PdfExtractor):
         current_produto = None
         in_produtos_section = False
         
-        for i, linha in enumerate(linhas):
-            # 1. Normalização de espaços (converte tabs, nbsp, múltiplos espaços em 1 espaço simples)
-            linha_limpa = " ".join(linha.split())
-            
-            # 2. Corte manual por strings literais (mais seguro que regex para casos teimosos)
-            # Converte para maiúsculas para verificar, mas corta na string original
-            upper_line = linha_limpa.upper()
-            
-            # Termos que DETONAM o resto da linha
-            hard_terms = [
-                "DADOS DO COD", "DADOS DO CÓD", "DADOS COMERCIAIS", 
-                "DADOS PARA FATURAMENTO", "RAZÃO SOCIAL:", "RAZAO SOCIAL:",
-                "SUPERUS", "PÁGINA:", "PAGINA:", "COD/NOME", "COD/ NOME", "DADOS DO"
-            ]
-            
-            for term in hard_terms:
-                idx = upper_line.find(term)
-                if idx != -1:
-                    linha_limpa = linha_limpa[:idx].strip()
-                    upper_line = upper_line[:idx] # Atualiza para proxima iteração
+        # 1. Normalização de espaços (converte tabs, nbsp, múltiplos espaços em 1 espaço simples),
+        # feita uma vez só e já descartando as linhas em branco, que nenhum passo usa
+        linhas = [linha for linha in (" ".join(linha.split()) for linha in linhas) if linha]
+        
+        for linha_limpa in linhas:
+            # 2. Corte por termos literais: a linha termina no primeiro termo encontrado
+            # (uma busca só, sem diferenciar maiúsculas)
+            match_corte = self._RE_TERMOS_CORTE.search(linha_limpa)
+            if match_corte:
+                linha_limpa = linha_limpa[:match_corte.start()].strip()
             
             # 3. Regex como fallback para outros casos (datas, fornecedores etc)
-            triggers = [
-                r'Usuário:', r'Emissão:', r'Fornecedor:', 
-                r'Substituição', r'Data Entrega:', r'Data Fat:', r'Número de Registros', 
-                r'Valor Total', r'Vendedor', r'Comprador', r'Direção'
-            ]
-            split_pattern = '|'.join(triggers)
-            linha_limpa = re.split(split_pattern, linha_limpa, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+            linha_limpa = self._RE_GATILHOS.split(linha_limpa, maxsplit=1)[0].strip()
             
             # Detectar início de novo pedido
             # Busca todas as ocorrências na linha
-            matches_pedido = re.finditer(r'(?:PEDIDO DE COMPRAS|Número do Pedido|Pedido|Nº|Numero)[:\s]+(\d+)', linha_limpa, re.IGNORECASE)
+            matches_pedido = self._RE_PEDIDO.finditer(linha_limpa)
             
             for match in matches_pedido:
                 cand_numero = match.group(1)
@@ -748,44 +969,42 @@ class MondelezExtractor(PdfExtractor):
             if not current_pedido:
                 continue
             
-            # Cabeçalhos genéricos (Mondelez costuma usar R. Social também)
-            if 'R. Social' in linha_limpa:
-                if 'REDE BIZ' in linha_limpa.upper() and not current_pedido['Fornecedor']:
-                     current_pedido['Fornecedor'] = 'REDE BIZ SERVICOS E DISTRIBUICAO'
-                elif not current_pedido['Cliente']:
-                    # Tenta capturar tudo após R. Social
-                    match = re.search(r'R\. Social\s+(.+)', linha_limpa)
-                    if match:
-                        current_pedido['Cliente'] = match.group(1).strip()
-
-            # CNPJs
-            if 'CNPJ' in linha_limpa:
-                cnpjs = re.findall(r'(\d{2}\.\d{3}\.\d{3}\/\d{4}-\d{2})', linha_limpa)
-                if cnpjs:
-                    if 'REDE BIZ' in linha_limpa:
-                        current_pedido['CNPJ Fornecedor'] = cnpjs[0]
+            # Linhas sem nenhuma palavra-chave de cabeçalho (a maioria: produtos, rodapés)
+            # pulam o bloco todo com uma única busca
+            if self._RE_TEM_CABECALHO.search(linha_limpa):
+                # Busca de 'REDE BIZ' feita uma vez e reaproveitada pelos blocos R. Social e CNPJ
+                tem_rede_biz = 'REDE BIZ' in linha_limpa
+
+                # Cabeçalhos genéricos (Mondelez costuma usar R. Social também)
+                if 'R. Social' in linha_limpa:
+                    if (tem_rede_biz or 'REDE BIZ' in linha_limpa.upper()) and not current_pedido['Fornecedor']:
+                         current_pedido['Fornecedor'] = 'REDE BIZ SERVICOS E DISTRIBUICAO'
+                    elif not current_pedido['Cliente']:
+                        # Tenta capturar tudo após R. Social
+                        match = self._RE_RAZAO_SOCIAL.search(linha_limpa)
+                        if match:
+                            current_pedido['Cliente'] = match.group(1).strip()
+
+                # CNPJs
+                if 'CNPJ' in linha_limpa:
+                    cnpjs = self._RE_CNPJ.findall(linha_limpa)
+                    if cnpjs:
+                        if tem_rede_biz:
+                            current_pedido['CNPJ Fornecedor'] = cnpjs[0]
+                        else:
+                            current_pedido['CNPJ Cliente'] = cnpjs[0]
                     else:
-                        current_pedido['CNPJ Cliente'] = cnpjs[0]
-                else:
-                    match_invert = re.search(r'CNPJ\s+-(\d{2})\s+([\d\.\/]+)', linha_limpa)
-                    if match_invert:
-                         current_pedido['CNPJ Cliente'] = f"{match_invert.group(2)}-{match_invert.group(1)}"
-
-            if 'Data limite para entrega' in linha_limpa:
-                match = re.search(r'Data limite para entrega\s+([\d\/]+)', linha_limpa)
-                if match: current_pedido['Data Limite Entrega'] = match.group(1)
-            
-            if 'Condição do frete' in linha_limpa:
-                match = re.search(r'Condição do frete\s+(.+)', linha_limpa)
-                if match: current_pedido['Condição Frete'] = match.group(1).strip()
-            
-            if 'Data da emissão' in linha_limpa:
-                match = re.search(r'Data da emissão\s+([\d\/]+)', linha_limpa)
-                if match: current_pedido['Data Emissão'] = match.group(1)
-                
-            if 'Valor total do pedido' in linha_limpa:
-                 match = re.search(r'Valor total do pedido\s+([\d\.,]+)', linha_limpa)
-                 if match: current_pedido['Valor Total'] = match.group(1)
+                        match_invert = self._RE_CNPJ_INVERTIDO.search(linha_limpa)
+                        if match_invert:
+                             current_pedido['CNPJ Cliente'] = f"{match_invert.group(2)}-{match_invert.group(1)}"
+
+                # Campos simples do cabeçalho: uma varredura da linha, despachando pelo grupo casado
+                achados = {}
+                for match in self._RE_CABECALHO.finditer(linha_limpa):
+                    # Vale a primeira ocorrência de cada campo na linha
+                    achados.setdefault(match.lastgroup, match.group(match.lastgroup))
+                for grupo, valor in achados.items():
+                    current_pedido[self._CAMPOS_CABECALHO[grupo]] = valor.strip()
 
             # Seção de Produtos - Detecção de Início
             # Flexível: Se encontrar qualquer indício de cabeçalho de produto
@@ -798,7 +1017,7 @@ class MondelezExtractor(PdfExtractor):
             # Verifica fim de seção
             if in_produtos_section:
                 if 'TOTAIS' in linha_limpa or 'DADOS ADICIONAIS' in linha_limpa or 'Total:' in linha_limpa:
-                    if current_produto: produtos_list.append(current_produto.copy())
+                    if current_produto: produtos_list.append(self._fechar_produto(current_produto))
                     current_produto = None
                     in_produtos_section = False
                     continue
@@ -809,101 +1028,40 @@ class MondelezExtractor(PdfExtractor):
 
             # Tenta combinar produtos MESMO se não detectou inicio de seção oficialmente
             # Isso é importante se o cabeçalho estiver em formato inesperado
-            if True: 
-                # LIMPEZA: Remove cabeçalhos embaralhados (comum em PDFs mal formatados)
-                linha_limpa_processada = self._clean_garbled_line(linha_limpa)
-                
-                # Tentativa de match MULTI-FORMATO GENÉRICO
-                # Captura 1 ou 2 números no início e decide quem é EAN e quem é Código
-                # Regex Smart: âncora ^, grupo 1 (num1), grupo 2 opcional (num2), resto
-                # Atualizado para capturar numero na embalagem (CX 144)
-                regex_smart = r'^\s*(\d+)\s+(?:(\d+)\s+)?(.+?)\s+(\d+)\s+((?:UN|CX|PC|KG|LT)(?:\s+\d+)?).*?(\d+,\d+)\s+[\d,\.]+\s+([\d,\.]+)$'
-                match_smart = re.search(regex_smart, linha_limpa_processada)
-
-                # Formato B (Antigo/Rede Biz padrão): Cod ... Price ... Qty ... Desc
-                match_format_b = re.search(r'^(\d{6})\s+.*?\s+([\d\.,]+)\s+([\d\.,]+)\s+([\d\.,]+)\s+((?:UN|CX|PC|KG|LT)(?:\s+\d+)?)\s+(\d+)\s+(.+)$', linha_limpa_processada)
-
-                if match_smart:
-                    in_produtos_section = True 
-                    if current_produto: produtos_list.append(current_produto.copy())
-                    
-                    n1 = match_smart.group(1)
-                    n2 = match_smart.group(2)
-                    
-                    ean, code = "", ""
-                    if n1 and n2:
-                        # Dois números: Assumimos EAN + Code (padrão 789... 123456)
-                        ean, code = n1, n2
-                    elif n1:
-                         # Apenas um número: Decidir pelo tamanho
-                         if len(n1) > 7:
-                             ean = n1
-                             code = "" # Sem código fornecedor
-                         else:
-                             code = n1
-                             ean = "" # Sem EAN
-
-                    current_produto = {
-                        'Número do Pedido': current_pedido['Número do Pedido'],
-                        'Código Fornecedor': code,
-                        'Valor Unit.': match_smart.group(6),
-                        'Quantidade': match_smart.group(4),
-                        'Embalagem': match_smart.group(5),
-                        'Sequência': '0',
-                        'Descrição': match_smart.group(3).strip(),
-                        'EAN': ean
-                    }
-                
-                elif match_format_b:
-                    in_produtos_section = True 
-                    if current_produto: produtos_list.append(current_produto.copy())
-                    current_produto = {
-                        'Número do Pedido': current_pedido['Número do Pedido'],
-                        'Código Fornecedor': match_format_b.group(1),
-                        'Valor Unit.': match_format_b.group(3), 
-                        'Quantidade': match_format_b.group(4),
-                        'Embalagem': match_format_b.group(5),
-                        'Sequência': match_format_b.group(6),
-                        'Descrição': match_format_b.group(7).strip(),
-                        'EAN': ''
-                    }
-                
-                elif current_produto and in_produtos_section:
-                    # Linhas de continuação (só se estivermos explicitamente na seção)
-                    if 'EAN' in linha_limpa:
-                         match_ean = re.search(r'EANs?:\s*([\d,\s]+)', linha_limpa)
-                         if match_ean: current_produto['EAN'] = match_ean.group(1).strip()
-                    elif len(linha_limpa) > 3 and not re.match(r'^\d', linha_limpa):
-                         # GUARD CLAUSE: Evitar pegar rodapé como descrição
-                         upl = linha_limpa.upper()
-                         blocked = [
-                             "DADOS", "TOTAL", "PÁGINA", "PAGINA", "SUPERUS", "COD/NOME", "CODIGO FORNECEDOR",
-                             "QUANTIDADE DE PEÇAS", "DATA DE ENTREGA", "PRAZO", "E-MAIL", "FRETE", 
-                             "TRANSPORTADORA", "DATA DE VENCIMENTO", "TIPO DE TROCA"
-                         ]
-                         
-                         ignored = ['Bairro', 'Cidade', 'CNPJ', 'Endereço', 'Telefone', 'Inscrição', 'Pedido', 'CNPJ']
-                         
-                         is_blocked = any(b in upl for b in blocked)
-                         is_ignored = any(x in linha_limpa for x in ignored)
-                         
-                         if not is_blocked and not is_ignored:
-                             current_produto['Descrição'] += ' ' + linha_limpa
-
-        if current_produto: produtos_list.append(current_produto)
+            novo_produto = self._produto_da_linha(linha_limpa, current_pedido['Número do Pedido'])
+
+            if novo_produto:
+                in_produtos_section = True
+                if current_produto: produtos_list.append(self._fechar_produto(current_produto))
+                current_produto = novo_produto
+
+            elif current_produto and in_produtos_section:
+                # Linhas de continuação (só se estivermos explicitamente na seção)
+                if 'EAN' in linha_limpa:
+                     match_ean = self._RE_EANS.search(linha_limpa)
+                     if match_ean: current_produto['EAN'] = match_ean.group(1).strip()
+                elif len(linha_limpa) > 3 and not linha_limpa[:1].isdigit():
+                     # GUARD CLAUSE: Evitar pegar rodapé como descrição
+                     upl = linha_limpa.upper()
+                     is_blocked = self._RE_BLOQUEADOS.search(upl) is not None
+                     is_ignored = self._RE_IGNORADOS.search(linha_limpa) is not None
+                     
+                     if not is_blocked and not is_ignored:
+                         current_produto['Descrição'].append(linha_limpa)
+
+        if current_produto: produtos_list.append(self._fechar_produto(current_produto))
         if current_pedido: pedidos.append(current_pedido)
         
+        # Colunas fixas: o pandas não precisa inferir a união das chaves de cada dict
         dfs = []
-        if pedidos: dfs.append(pd.DataFrame(pedidos))
+        if pedidos: dfs.append(pd.DataFrame.from_records(pedidos, columns=self._COLUNAS_PEDIDO))
         if produtos_list:
-            df_prod = pd.DataFrame(produtos_list)
+            # 'Código Fornecedor' já chega como int (0 quando ausente): a coluna nasce int64
+            df_prod = pd.DataFrame.from_records(produtos_list, columns=self._COLUNAS_PRODUTO)
             for col in ['Quantidade', 'Valor Unit.']:
                 if col in df_prod.columns:
-                    df_prod[col] = df_prod[col].apply(self._conv_num)
+                    df_prod[col] = numeros_br(df_prod[col])
             
-            if 'Código Fornecedor' in df_prod.columns:
-                 df_prod['Código Fornecedor'] = pd.to_numeric(df_prod['Código Fornecedor'], errors='coerce').fillna(0).astype('int64')
-                 
             if 'Sequência' in df_prod.columns:
                 df_prod = df_prod.drop(columns=['Sequência'])
                 
@@ -911,6 +1069,70 @@ class MondelezExtractor(PdfExtractor):
             
         return dfs
 
+    def _produto_da_linha(self, linha_limpa, numero_pedido):
+        """Monta o dict do produto se a linha casar com um dos formatos de produto; senão, None."""
+        # LIMPEZA: Remove cabeçalhos embaralhados (comum em PDFs mal formatados)
+        linha = self._clean_garbled_line(linha_limpa)
+
+        # Linha de produto começa com dígito (a linha já vem sem espaços nas bordas)
+        # e tem uma embalagem depois de um espaço; sem isso nenhum formato casa
+        # e as regexes de produto (caras, cheias de .+? / .*?) nem rodam
+        if not (linha[:1].isdigit() and self._RE_TEM_EMBALAGEM.search(linha)):
+            return None
+
+        # Tentativa de match MULTI-FORMATO GENÉRICO
+        # Captura 1 ou 2 números no início e decide quem é EAN e quem é Código
+        # Regex Smart: âncora ^, grupo 1 (num1), grupo 2 opcional (num2), resto
+        # Atualizado para capturar numero na embalagem (CX 144)
+        match_smart = self._RE_SMART.search(linha)
+        if match_smart:
+            n1 = match_smart.group(1)
+            n2 = match_smart.group(2)
+            
+            ean, code = "", ""
+            if n1 and n2:
+                # Dois números: Assumimos EAN + Code (padrão 789... 123456)
+                ean, code = n1, n2
+            elif n1:
+                 # Apenas um número: Decidir pelo tamanho
+                 if len(n1) > 7:
+                     ean = n1
+                     code = "" # Sem código fornecedor
+                 else:
+                     code = n1
+                     ean = "" # Sem EAN
+
+            return {
+                'Número do Pedido': numero_pedido,
+                'Código Fornecedor': int(code) if code else 0,
+                'Valor Unit.': match_smart.group(6),
+                'Quantidade': match_smart.group(4),
+                'Embalagem': match_smart.group(5),
+                'Sequência': '0',
+                'Descrição': [match_smart.group(3).strip()],  # partes, unidas em _fechar_produto
+                'EAN': ean
+            }
+
+        # Formato B (Antigo/Rede Biz padrão): Cod ... Price ... Qty ... Desc
+        match_format_b = self._RE_FORMATO_B.search(linha)
+        if match_format_b:
+            return {
+                'Número do Pedido': numero_pedido,
+                'Código Fornecedor': int(match_format_b.group(1)),
+                'Valor Unit.': match_format_b.group(3), 
+                'Quantidade': match_format_b.group(4),
+                'Embalagem': match_format_b.group(5),
+                'Sequência': match_format_b.group(6),
+                'Descrição': [match_format_b.group(7).strip()],
+                'EAN': ''
+            }
+        return None
+
+    def _fechar_produto(self, produto):
+        """Une as partes da descrição (linha do produto + continuações) quando o produto é salvo."""
+        produto['Descrição'] = ' '.join(produto['Descrição'])
+        return produto
+
     def _novo_pedido_dict(self, numero):
         return {
             'Número do Pedido': numero,
@@ -921,27 +1143,28 @@ class MondelezExtractor(PdfExtractor):
             'Data Emissão': '', 'Valor Total': ''
         }
 
-    def _conv_num(self, val):
-        if isinstance(val, str):
-            val = val.replace('.', '').replace(',', '.')
-            try: return float(val)
-            except: return 0.0
-        return val
-
 class SilveiraExtractor(PdfExtractor):
     """Extract structured data from Silveira Supermercado purchase orders"""
+
+    _RE_PEDIDO       = re.compile(r'Pedido:\s*(\d+)')
+    _RE_DATA_ENTREGA = re.compile(r'Data Entrega:\s*([\d\/]+)')
+    _RE_EMISSAO      = re.compile(r'Emissão:\s*([\d\/]+)')
+    _RE_TOTAL        = re.compile(r'Total\s*-+>\s*([\d\.,]+)')
+    _RE_PRODUTO      = re.compile(r'^\d+\s+\d+\s+(.+?)\s+([A-Z]{2})\s+([\d\s,]+)\s+([\d,]+)\s+([\d,]+)\s+(\d+)$')
     
     def extract(self, file_path):
         try:
             # Extract all text from PDF using PyPDF2 (works well for this format)
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                texto_completo = ""
-                for page in reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        texto_completo += text + "\n"
-            
+            import PyPDF2
+            reader = PyPDF2.PdfReader(file_path)
+            # Textos das páginas numa lista, unidos uma vez só no final
+            partes = []
+            for page in reader.pages:
+                text = page.extract_text()
+                if text:
+                    partes.append(text + "\n")
+            
+            texto_completo = "".join(partes)
             linhas = texto_completo.split('\n')
             return self._process_silveira_text(linhas)
         except Exception as e:
@@ -972,7 +1195,7 @@ class SilveiraExtractor(PdfExtractor):
 
             # Header Info
             if 'Pedido:' in linha_limpa:
-                match = re.search(r'Pedido:\s*(\d+)', linha_limpa)
+                match = self._RE_PEDIDO.search(linha_limpa)
                 if match:
                     current_pedido['Número do Pedido'] = match.group(1)
             
@@ -980,24 +1203,24 @@ class SilveiraExtractor(PdfExtractor):
                 current_pedido['Cliente'] = 'SUPERMERCADO SILVEIRA LTDA'
                 
             if 'Data Entrega:' in linha_limpa:
-                match = re.search(r'Data Entrega:\s*([\d\/]+)', linha_limpa)
+                match = self._RE_DATA_ENTREGA.search(linha_limpa)
                 if match:
                     current_pedido['Data Entrega'] = match.group(1)
                     
             if 'Data Hora Emissão:' in linha_limpa:
-                 match = re.search(r'Emissão:\s*([\d\/]+)', linha_limpa)
+                 match = self._RE_EMISSAO.search(linha_limpa)
                  if match:
                      current_pedido['Data Emissão'] = match.group(1)
 
             # Valor total (footer)
             if 'Total' in linha_limpa and '----------->' in linha_limpa:
-                 match = re.search(r'Total\s*-+>\s*([\d\.,]+)', linha_limpa)
+                 match = self._RE_TOTAL.search(linha_limpa)
                  if match:
                      current_pedido['Valor Total'] = match.group(1)
 
             # Product Line Detection
             # Regex: Start with digits, space, digits, space ... ends with digits (13-14 chars for EAN)
-            match_prod = re.search(r'^\d+\s+\d+\s+(.+?)\s+([A-Z]{2})\s+([\d\s,]+)\s+([\d,]+)\s+([\d,]+)\s+(\d+)$', linha_limpa)
+            match_prod = self._RE_PRODUTO.search(linha_limpa)
             
             if match_prod:
                 desc = match_prod.group(1)
@@ -1035,20 +1258,10 @@ class SilveiraExtractor(PdfExtractor):
         if produtos_list:
             df_produtos = pd.DataFrame(produtos_list)
             
-            # Converters
-            def conv_num(val):
-                if isinstance(val, str):
-                    val_clean = val.replace('.', '').replace(',', '.')
-                    try:
-                        return float(val_clean)
-                    except ValueError:
-                        return 0.0
-                return val
-
-            cols_float = ['Quantidade', 'Valor Unit.', 'Valor Total']
-            for col in cols_float:
+            # Textos BR -> float de uma vez só (vazio ou inválido vira 0.0)
+            for col in ['Quantidade', 'Valor Unit.', 'Valor Total']:
                 if col in df_produtos.columns:
-                    df_produtos[col] = df_produtos[col].apply(conv_num)
+                    df_produtos[col] = numeros_br(df_produtos[col])
             
             if 'EAN' in df_produtos.columns:
                  df_produtos['EAN'] = pd.to_numeric(df_produtos['EAN'], errors='coerce').fillna(0).astype('int64')
@@ -1059,16 +1272,28 @@ class SilveiraExtractor(PdfExtractor):
 
 class BernardaoExtractor(PdfExtractor):
     """Extract structured data from Bernardao Supermercado purchase orders"""
+
+    _RE_PEDIDO      = re.compile(r'-\s*(\d+)\s*/L')
+    _RE_DATA        = re.compile(r'(\d{2}/\d{2}/\d{4})')
+    _RE_VALOR_TOTAL = re.compile(r'([\d\.,]+)\s+Valor total')
+    _RE_CNPJ        = re.compile(r'CNPJ\s*-(\d{2})\s+(\d{2}\.\d{3}\.\d{3}/\d{4})')
+    _RE_EANS        = re.compile(r'EANs:\s*([\d,\s]+)')
+    _RE_PIVOT       = re.compile(r'([A-Z]{2})\s+(\d+)\s+([\d\.,]+)\s+([\d\.,]+)')
+    # Cabeçalhos/rodapés que não entram na descrição: uma busca por linha
+    _IGNORAR = ('TOTVS', '--- Page', 'PEDIDO DE', 'FORNECEDOR', 'DADOS PARA', 'R. Social', 'Endereço', 'Bairro', 'Cidade', 'Cep', 'Transportador', 'Inscrição Estadual')
+    _RE_IGNORAR     = re.compile('|'.join(map(re.escape, _IGNORAR)))
     
     def extract(self, file_path):
         try:
             with pdfplumber.open(file_path) as pdf:
-                texto_completo = ""
+                # Textos das páginas numa lista, unidos uma vez só no final
+                partes = []
                 for page in pdf.pages:
                     text = page.extract_text()
                     if text:
-                        texto_completo += text + "\n"
+                        partes.append(text + "\n")
             
+            texto_completo = "".join(partes)
             linhas = texto_completo.split('\n')
             return self._process_bernardao_text(linhas)
         except Exception as e:
@@ -1089,7 +1314,7 @@ class BernardaoExtractor(PdfExtractor):
                 
             # New Order Detection
             if 'PEDIDO DE' in linha_limpa and '/L' in linha_limpa:
-                match = re.search(r'-\s*(\d+)\s*/L', linha_limpa)
+                match = self._RE_PEDIDO.search(linha_limpa)
                 if match:
                     new_pedido_id = match.group(1)
                     
@@ -1116,17 +1341,17 @@ class BernardaoExtractor(PdfExtractor):
 
             # Header Metadata
             if 'Data da emissão' in linha_limpa:
-                 match = re.search(r'(\d{2}/\d{2}/\d{4})', linha_limpa)
+                 match = self._RE_DATA.search(linha_limpa)
                  if match: current_pedido['Data Emissão'] = match.group(1)
             
             if 'Valor total do pedido' in linha_limpa:
-                 match = re.search(r'([\d\.,]+)\s+Valor total', linha_limpa)
+                 match = self._RE_VALOR_TOTAL.search(linha_limpa)
                  if match: current_pedido['Valor Total'] = match.group(1)
 
             # CNPJ Parsing
             # Pattern: CNPJ -86 18.468.199/0013
             if 'CNPJ' in linha_limpa:
-                 match = re.search(r'CNPJ\s*-(\d{2})\s+(\d{2}\.\d{3}\.\d{3}/\d{4})', linha_limpa)
+                 match = self._RE_CNPJ.search(linha_limpa)
                  if match:
                      # Reconstruct standard format: 18.468.199/0013-86
                      cnpj_root = match.group(2)
@@ -1137,8 +1362,7 @@ class BernardaoExtractor(PdfExtractor):
             # Layout appears to be: Code Seq Desc EmbType EmbQty Qty ValUnit ...
             # We look for the "Pivot": EmbType EmbQty Qty ValUnit
             # Ex: CX 315 1,00 431,5500
-            regex_pivot = r'([A-Z]{2})\s+(\d+)\s+([\d\.,]+)\s+([\d\.,]+)'
-            match_pivot = re.search(regex_pivot, linha_limpa)
+            match_pivot = self._RE_PIVOT.search(linha_limpa)
 
             if match_pivot:
                 # Pivots
@@ -1214,7 +1438,7 @@ class BernardaoExtractor(PdfExtractor):
             # Continuation or EANs
             if current_produto:
                 if 'EANs:' in linha_limpa:
-                    match_ean = re.search(r'EANs:\s*([\d,\s]+)', linha_limpa)
+                    match_ean = self._RE_EANS.search(linha_limpa)
                     if match_ean:
                         eans = match_ean.group(1).replace(' ', '').split(',')
                         if eans:
@@ -1229,8 +1453,7 @@ class BernardaoExtractor(PdfExtractor):
                     continue
                 
                 # Ignore headers/footers in description (keep current_produto active)
-                ignore_patterns = ['TOTVS', '--- Page', 'PEDIDO DE', 'FORNECEDOR', 'DADOS PARA', 'R. Social', 'Endereço', 'Bairro', 'Cidade', 'Cep', 'Transportador', 'Inscrição Estadual']
-                if any(pat in linha_limpa for pat in ignore_patterns):
+                if self._RE_IGNORAR.search(linha_limpa):
                     continue
 
                 # Append to description
@@ -1249,20 +1472,10 @@ class BernardaoExtractor(PdfExtractor):
         if produtos_list:
             df_produtos = pd.DataFrame(produtos_list)
             
-            # Converters
-            def conv_num(val):
-                if isinstance(val, str):
-                    val_clean = val.replace('.', '').replace(',', '.')
-                    try:
-                        return float(val_clean)
-                    except ValueError:
-                        return 0.0
-                return val
-
-            cols_float = ['Quantidade', 'Valor Unit.', 'Valor Total']
-            for col in cols_float:
+            # Textos BR -> float de uma vez só (vazio ou inválido vira 0.0)
+            for col in ['Quantidade', 'Valor Unit.', 'Valor Total']:
                 if col in df_produtos.columns:
-                    df_produtos[col] = df_produtos[col].apply(conv_num)
+                    df_produtos[col] = numeros_br(df_produtos[col])
             
             if 'EAN' in df_produtos.columns:
                  df_produtos['EAN'] = pd.to_numeric(df_produtos['EAN'], errors='coerce').fillna(0).astype('int64')
@@ -1273,17 +1486,30 @@ class BernardaoExtractor(PdfExtractor):
 
 class TresIrmaosExtractor(PdfExtractor):
     """Extrator para pedidos do Supermercado 3 Irmãos"""
+
+    _RE_ORDEM_COMPRA = re.compile(r'Ordem de Compra N. (\d+)')
+    _RE_CNPJ         = re.compile(r'(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})')
+    _RE_CIDADE       = re.compile(r'CEP\d{5}-\d{3}\s+(.+?)\s+Cidade:')
+    _RE_TOTAL_GERAL  = re.compile(r'([\d\.,]+)\s+([\d\.,]+)\s+Total Geral:')
+    _RE_TOTAL        = re.compile(r'([\d\.,]+)\s+Total:')
+    _RE_MAIUSCULA    = re.compile(r'[A-Z]')
+    _RE_CODIGO       = re.compile(r',000000(\d+)')
+    _RE_EAN_EMB      = re.compile(r',000000(UN|CX|PT|DZ|PC|KG|LT)(?:\s+)?(.+)')
+    _RE_NUMERICO     = re.compile(r'^[\d\.,]+$')
+    _RE_ANCORA       = re.compile(r'^([\d\.,]+)\s+,000\s+([\d\.,]+)\s+([\d\.,]+)(.*)$')
     
     def extract(self, file_path):
         try:
-            texto_completo = ""
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                for page in reader.pages:
-                    text = page.extract_text()
-                    if text:
-                        texto_completo += text + "\n"
-            
+            # Textos das páginas numa lista, unidos uma vez só no final
+            partes = []
+            import PyPDF2
+            reader = PyPDF2.PdfReader(file_path)
+            for page in reader.pages:
+                text = page.extract_text()
+                if text:
+                    partes.append(text + "\n")
+            
+            texto_completo = "".join(partes)
             linhas = texto_completo.split('\n')
             return self._process_text(linhas)
         except Exception as e:
@@ -1313,7 +1539,7 @@ class TresIrmaosExtractor(PdfExtractor):
             # --- Header Detection ---
             # Ordem de Compra Nº 38709
             if 'Ordem de Compra' in linha:
-                match = re.search(r'Ordem de Compra N. (\d+)', linha.replace('º', '.').replace('°', '.'))
+                match = self._RE_ORDEM_COMPRA.search(linha.replace('º', '.').replace('°', '.'))
                 if match:
                     order_num = match.group(1)
                     
@@ -1333,7 +1559,7 @@ class TresIrmaosExtractor(PdfExtractor):
                 # CNPJ
                 if not current_pedido['CNPJ'] and 'CNPJ:' in linha:
                      # Ex: 01.447.141/0003-81 CNPJ:Empresa Emitente: 4
-                     match = re.search(r'(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})', linha)
+                     match = self._RE_CNPJ.search(linha)
                      if match:
                          current_pedido['CNPJ'] = match.group(1)
 
@@ -1345,7 +1571,7 @@ class TresIrmaosExtractor(PdfExtractor):
                     # Mas o texto extraido do PDF coloca Cidade: DEPOIS do valor as vezes?
                     # Line 6: CEP38290-000 CARNEIRINHO MG Cidade:Planilha...
                     # Regex: Captura texto entre CEP (ou inicio) e Cidade:
-                    match = re.search(r'CEP\d{5}-\d{3}\s+(.+?)\s+Cidade:', linha)
+                    match = self._RE_CIDADE.search(linha)
                     if match:
                          current_pedido['Cidade'] = match.group(1).strip()
 
@@ -1353,19 +1579,18 @@ class TresIrmaosExtractor(PdfExtractor):
                 if 'Total Geral:' in linha or 'Total:' in linha:
                      # Ex: ,000 8.492,63 1.023,000 Total Geral:
                      # Group 1: 8.492,63 (Value), Group 2: 1.023,000 (Qty)
-                     match = re.search(r'([\d\.,]+)\s+([\d\.,]+)\s+Total Geral:', linha)
+                     match = self._RE_TOTAL_GERAL.search(linha)
                      if match:
                          current_pedido['Valor Total'] = match.group(1)
                      else:
                          # Fallback: Capture last number if explicit "Total:" exists (Page 6: 8.495,20 Total:)
-                         match_simple = re.search(r'([\d\.,]+)\s+Total:', linha)
+                         match_simple = self._RE_TOTAL.search(linha)
                          if match_simple:
                              current_pedido['Valor Total'] = match_simple.group(1)
 
             # --- Product Detection (Anchor Line) ---
             # Regex Anchor
-            regex_anchor = r'^([\d\.,]+)\s+,000\s+([\d\.,]+)\s+([\d\.,]+)(.*)$'
-            match_anchor = re.search(regex_anchor, linha)
+            match_anchor = self._RE_ANCORA.search(linha)
             
             if match_anchor and current_pedido:
                 val_unit = match_anchor.group(1)
@@ -1386,13 +1611,13 @@ class TresIrmaosExtractor(PdfExtractor):
                     if idx > 8: break # Não olhar muito longe
                     
                     # Teste Code: ,000000(\d+) isolado
-                    if ',000000' in prev_line and not re.search(r'[A-Z]', prev_line):
-                         match_code = re.search(r',000000(\d+)', prev_line)
+                    if ',000000' in prev_line and not self._RE_MAIUSCULA.search(prev_line):
+                         match_code = self._RE_CODIGO.search(prev_line)
                          if match_code and not code:
                              code = match_code.group(1)
                     
                     # Teste EAN/Emb: ,000000(UN|CX|...)
-                    match_ean = re.search(r',000000(UN|CX|PT|DZ|PC|KG|LT)(?:\s+)?(.+)', prev_line)
+                    match_ean = self._RE_EAN_EMB.search(prev_line)
                     if match_ean and not ean:
                         full_num = match_ean.group(2).replace(' ', '')
                         if len(full_num) > 6:
@@ -1411,7 +1636,7 @@ class TresIrmaosExtractor(PdfExtractor):
                 offset = 1
                 while i + offset < len(linhas):
                     next_line = linhas[i+offset].strip()
-                    if re.match(r'^[\d\.,]+$', next_line): 
+                    if self._RE_NUMERICO.match(next_line): 
                         break
                     if '--- Page' in next_line or 'Page' in next_line:
                         break
@@ -1443,20 +1668,10 @@ class TresIrmaosExtractor(PdfExtractor):
             
         if produtos_list:
             df_prod = pd.DataFrame(produtos_list)
-             # Converters
-            def conv_num(val):
-                if isinstance(val, str):
-                    val_clean = val.replace('.', '').replace(',', '.')
-                    try:
-                        return float(val_clean)
-                    except ValueError:
-                        return 0.0
-                return val
-
-            cols_float = ['Quantidade', 'Valor', 'Valor Total']
-            for col in cols_float:
+            # Textos BR -> float de uma vez só (vazio ou inválido vira 0.0)
+            for col in ['Quantidade', 'Valor', 'Valor Total']:
                 if col in df_prod.columns:
-                    df_prod[col] = df_prod[col].apply(conv_num)
+                    df_prod[col] = numeros_br(df_prod[col])
                     
             if 'Código de barras' in df_prod.columns:
                  df_prod['Código de barras'] = pd.to_numeric(df_prod['Código de barras'], errors='coerce').fillna(0).astype('int64')
@@ -1467,6 +1682,8 @@ class TresIrmaosExtractor(PdfExtractor):
 
 class RedeLucasExtractor(PdfExtractor):
     """Extrator especifico para formato REDE LUCAS"""
+
+    _RE_CNPJ_EMPRESA = re.compile(r'Empresa:[\s\S]*?CNPJ:\s*([\d\.\/\-]+)')
     def extract(self, file_path):
         tabelas = []
         cnpj_loja = ""
@@ -1481,7 +1698,7 @@ class RedeLucasExtractor(PdfExtractor):
                 for page in pdf.pages:
                     text = page.extract_text()
                     if text:
-                        match = re.search(r'Empresa:[\s\S]*?CNPJ:\s*([\d\.\/\-]+)', text)
+                        match = self._RE_CNPJ_EMPRESA.search(text)
                         if match:
                             cnpj_loja = match.group(1)
                             break
@@ -1538,6 +1755,8 @@ class RedeLucasExtractor(PdfExtractor):
 
 class SupermaxiExtractor(PdfExtractor):
     """Extrator especifico para formato SUPERMAXI"""
+
+    _RE_CNPJ_EMPRESA = re.compile(r'Empresa:[\s\S]*?CNPJ:\s*([\d\.\/\-]+)')
     def extract(self, file_path):
         tabelas = []
         cnpj_loja = ""
@@ -1553,7 +1772,7 @@ class SupermaxiExtractor(PdfExtractor):
                 for page in pdf.pages:
                     text = page.extract_text()
                     if text:
-                        match = re.search(r'Empresa:[\s\S]*?CNPJ:\s*([\d\.\/\-]+)', text)
+                        match = self._RE_CNPJ_EMPRESA.search(text)
                         if match:
                             cnpj_loja = match.group(1)
                             break
@@ -1637,6 +1856,15 @@ class KamelExtractor(PdfExtractor):
         r'([\d\.,]+)\s+([\d\.,]+)\s+([\d\.,]+)$' # 8- Pr.Unit, 9- Pr.Emb, 10- Vlr.Total
     )
 
+    _RE_PEDIDO       = re.compile(r'N[ºo°\.\u00ba]\s*Pedido:\s*(\d+)')
+    _RE_CNPJ         = re.compile(r'CNPJ:\s*([\d.\/\-]+)')
+    _RE_RAZAO_SOCIAL = re.compile(r'Raz[aã]o Social:\s*(.+?)(?:CNPJ:|$)', re.IGNORECASE)
+    _RE_FORNECEDOR   = re.compile(r'Fornecedor:\s*(.+?)(?:\n|Substitui|Data)', re.IGNORECASE | re.DOTALL)
+    _RE_DATA_ENTREGA = re.compile(r'Data Entrega:\s*([\d\/]+)')
+    _RE_EMISSAO      = re.compile(r'Emiss[aã]o:\s*([\d\/]+)')
+    _RE_PAGINA_1     = re.compile(r'P[aá]gina:\s*1\b')
+    _RE_INICIO_EAN   = re.compile(r'^\d{8,14}\s')
+
     def _extrair_cabecalho(self, texto_pagina):
         """Extrai metadados do cabeçalho da página."""
         info = {
@@ -1650,27 +1878,27 @@ class KamelExtractor(PdfExtractor):
         if not texto_pagina:
             return info
 
-        m = re.search(r'N[ºo°\.\u00ba]\s*Pedido:\s*(\d+)', texto_pagina)
+        m = self._RE_PEDIDO.search(texto_pagina)
         if m:
             info['Nº Pedido'] = m.group(1)
 
-        m = re.search(r'CNPJ:\s*([\d.\/\-]+)', texto_pagina)
+        m = self._RE_CNPJ.search(texto_pagina)
         if m:
             info['CNPJ'] = m.group(1)
 
-        m = re.search(r'Raz[aã]o Social:\s*(.+?)(?:CNPJ:|$)', texto_pagina, re.IGNORECASE)
+        m = self._RE_RAZAO_SOCIAL.search(texto_pagina)
         if m:
             info['Razão Social'] = m.group(1).strip()
 
-        m = re.search(r'Fornecedor:\s*(.+?)(?:\n|Substitui|Data)', texto_pagina, re.IGNORECASE | re.DOTALL)
+        m = self._RE_FORNECEDOR.search(texto_pagina)
         if m:
             info['Fornecedor'] = m.group(1).strip().split('\n')[0].strip()
 
-        m = re.search(r'Data Entrega:\s*([\d\/]+)', texto_pagina)
+        m = self._RE_DATA_ENTREGA.search(texto_pagina)
         if m:
             info['Data Entrega'] = m.group(1)
 
-        m = re.search(r'Emiss[aã]o:\s*([\d\/]+)', texto_pagina)
+        m = self._RE_EMISSAO.search(texto_pagina)
         if m:
             info['Data Emissão'] = m.group(1)
 
@@ -1693,14 +1921,14 @@ class KamelExtractor(PdfExtractor):
 
                     # Detecta início de novo pedido: linha "Pedido de Compra Página: 1"
                     # Cada pedido começa numa página cujo cabeçalho contém "Página: 1"
-                    if re.search(r'P[aá]gina:\s*1\b', texto):
+                    if self._RE_PAGINA_1.search(texto):
                         cabecalho_info = self._extrair_cabecalho(texto)
 
                     linhas = texto.split('\n')
                     for line in linhas:
                         line = line.strip()
                         # Linha de produto começa com sequência de 8–14 dígitos (EAN)
-                        if re.match(r'^\d{8,14}\s', line):
+                        if self._RE_INICIO_EAN.match(line):
                             m = self._RE_PRODUTO.search(line)
                             if m:
                                 (ean, cod_forn, desc, qtde, emb, emb_qtd,
@@ -1793,6 +2021,13 @@ class BernardaoV2Extractor(PdfExtractor):
     _RE_DLIMITE  = re.compile(r'Data limite para entrega\s+([\d\/]+)', re.IGNORECASE)
     _RE_TOTAL    = re.compile(r'Valor total do pedido\s+([\d\.,]+)', re.IGNORECASE)
     _RE_EAN      = re.compile(r'EANs?:\s*([\d,\s]+)')
+    _RE_SO_NUMEROS = re.compile(r'^[\d,\.\s]+$')
+    _RE_NOME_LOJA = re.compile(r'SUPERMERCADO BERNARDAO LTDA\s+(SUPERMERCADO BERNARDAO[^\n]+)')
+    # Rodapé/cabeçalho de página no meio dos produtos: uma busca por linha
+    _PULAR = ('PEDIDO DE COMPRAS', 'FORNECEDOR', 'R. Social',
+              'Endere', 'Bairro', 'Cidade', 'Cep', 'Inscri',
+              'ENDERECO', 'COBRAN', 'ENTREGA', 'Cod Forn')
+    _RE_PULAR = re.compile('|'.join(map(re.escape, _PULAR)))
 
     def _conv_num(self, val):
         if isinstance(val, str) and val:
@@ -1826,7 +2061,7 @@ class BernardaoV2Extractor(PdfExtractor):
             info['CNPJ Loja'] = cnpjs[0]
 
         # Nome da loja — aparece após "SUPERMERCADO BERNARDAO LTDA"
-        m = re.search(r'SUPERMERCADO BERNARDAO LTDA\s+(SUPERMERCADO BERNARDAO[^\n]+)', texto)
+        m = self._RE_NOME_LOJA.search(texto)
         if m:
             info['Loja'] = m.group(1).strip()
 
@@ -1851,15 +2086,17 @@ class BernardaoV2Extractor(PdfExtractor):
     def extract(self, file_path):
         try:
             with pdfplumber.open(file_path) as pdf:
-                texto_completo = ''
+                # Textos das páginas numa lista, unidos uma vez só no final
+                partes = []
                 for page in pdf.pages:
                     t = page.extract_text()
                     if t:
-                        texto_completo += t + '\n'
+                        partes.append(t + '\n')
         except Exception as e:
             print(f"Erro no BernardaoV2Extractor (leitura): {e}")
             return []
 
+        texto_completo = ''.join(partes)
         cabecalho = self._extrair_cabecalho(texto_completo)
         linhas = texto_completo.split('\n')
 
@@ -1921,14 +2158,11 @@ class BernardaoV2Extractor(PdfExtractor):
                     continue
 
                 # Ignora linhas puramente numéricas (sub-totais, etc.)
-                if re.match(r'^[\d,\.\s]+$', linha_s):
+                if self._RE_SO_NUMEROS.match(linha_s):
                     continue
 
                 # Ignora rodapé/cabeçalho de página
-                skip_terms = ['PEDIDO DE COMPRAS', 'FORNECEDOR', 'R. Social',
-                              'Endere', 'Bairro', 'Cidade', 'Cep', 'Inscri',
-                              'ENDERECO', 'COBRAN', 'ENTREGA', 'Cod Forn']
-                if any(t in linha_s for t in skip_terms):
+                if self._RE_PULAR.search(linha_s):
                     continue
 
                 # Acumula descrição
@@ -2087,9 +2321,28 @@ class KiJoiaExtractor(PdfExtractor):
         r'([\d\.,\-]+)$'                     # 9. Valor Líquido
     )
 
+    _RE_DATA                = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+    _RE_EMPRESAS            = re.compile(r'EMPRESAS:\s*([\d,\s]+?)(?=\s+\d{2}/\d{2}/\d{4}|\n|$)')
+    _RE_DATA_EMPRESAS       = re.compile(r'EMPRESAS:.*?(\d{2}/\d{2}/\d{4})')
+    _RE_FORNECEDOR_VENDEDOR = re.compile(r'Fornecedor:\s*(.+?)(?:\s+Vendedor:|\n|$)')
+    _RE_CNPJ_CPF            = re.compile(r'CNPJ/CPF:\s*([\d\.\/\-]+)')
+    _RE_INSCRICAO           = re.compile(r'Ins:\s*(\d+)')
+    _RE_EAN                 = re.compile(r'^\d{8,14}$')
+    _RE_PEDIDO              = re.compile(r'N[uú]mero do Pedido:\s*(\d+)')
+    _RE_CNPJ                = re.compile(r'CNPJ:\s*([\d\.\/\-]+)')
+    _RE_LOJA                = re.compile(r'Empresa do Pedido:\s*(.+?)(?:\n|$)')
+    _RE_FORNECEDOR          = re.compile(r'Fornecedor:\s*(.+?)(?:\n|$)')
+    _RE_DATA_PEDIDO         = re.compile(r'Data do Pedido:\s*([\d\/]+)')
+    _RE_PREVISAO            = re.compile(r'Previs[aã]o de entrega:\s*([\d\/]+)')
+    _RE_INICIO_PRODUTO      = re.compile(r'^\d+\s+\d+\s+')
+    # Linhas de metadados no meio dos produtos (sem diferenciar maiúsculas): uma busca por linha
+    _METADADOS = ("fornecedor:", "processado por", "empresas:", "pré-pedido", "pr-pedido",
+                  "total de produtos", "código", "departamento:", "categoria:")
+    _RE_METADADOS           = re.compile('|'.join(map(re.escape, _METADADOS)), re.IGNORECASE)
+
     def _is_numeric_token(self, token):
         # Check if it matches a date
-        if re.match(r'^\d{2}/\d{2}/\d{4}$', token):
+        if self._RE_DATA.match(token):
             return True
         # Check if it's a number (possibly negative, with dots or commas)
         clean_token = token.replace('.', '').replace(',', '').replace('-', '')
@@ -2126,27 +2379,27 @@ class KiJoiaExtractor(PdfExtractor):
                         
                         # Extract header metadata if not already filled
                         if not info_cabecalho['Empresas']:
-                            m_emp = re.search(r'EMPRESAS:\s*([\d,\s]+?)(?=\s+\d{2}/\d{2}/\d{4}|\n|$)', text)
+                            m_emp = self._RE_EMPRESAS.search(text)
                             if m_emp:
                                 info_cabecalho['Empresas'] = m_emp.group(1).strip()
                                 
                         if not info_cabecalho['Data Pedido']:
-                            m_data = re.search(r'EMPRESAS:.*?(\d{2}/\d{2}/\d{4})', text)
+                            m_data = self._RE_DATA_EMPRESAS.search(text)
                             if m_data:
                                 info_cabecalho['Data Pedido'] = m_data.group(1).strip()
                                 
                         if not info_cabecalho['Fornecedor']:
-                            m_forn = re.search(r'Fornecedor:\s*(.+?)(?:\s+Vendedor:|\n|$)', text)
+                            m_forn = self._RE_FORNECEDOR_VENDEDOR.search(text)
                             if m_forn:
                                 info_cabecalho['Fornecedor'] = m_forn.group(1).strip()
                                 
                         if not info_cabecalho['CNPJ Fornecedor']:
-                            m_cnpj = re.search(r'CNPJ/CPF:\s*([\d\.\/\-]+)', text)
+                            m_cnpj = self._RE_CNPJ_CPF.search(text)
                             if m_cnpj:
                                 info_cabecalho['CNPJ Fornecedor'] = m_cnpj.group(1).strip()
                                 
                         if not info_cabecalho['Inscrição Estadual']:
-                            m_ie = re.search(r'Ins:\s*(\d+)', text)
+                            m_ie = self._RE_INSCRICAO.search(text)
                             if m_ie:
                                 info_cabecalho['Inscrição Estadual'] = m_ie.group(1).strip()
                         
@@ -2161,8 +2414,7 @@ class KiJoiaExtractor(PdfExtractor):
                                 continue
                                 
                             # Filter out metadata lines
-                            lower_line = line_limpa.lower()
-                            if any(k in lower_line for k in ["fornecedor:", "processado por", "empresas:", "pré-pedido", "pr-pedido", "total de produtos", "código", "departamento:", "categoria:"]):
+                            if self._RE_METADADOS.search(line_limpa):
                                 continue
                                 
                             # Scan from right to left to find unit index
@@ -2183,7 +2435,7 @@ class KiJoiaExtractor(PdfExtractor):
                             rest = head[1:]
                             
                             gtin = ""
-                            if rest and re.match(r'^\d{8,14}$', rest[-1]):
+                            if rest and self._RE_EAN.match(rest[-1]):
                                 gtin = rest[-1]
                                 descricao = " ".join(rest[:-1])
                             else:
@@ -2201,7 +2453,7 @@ class KiJoiaExtractor(PdfExtractor):
                             
                             date_idx = -1
                             for idx, tok in enumerate(remaining_tail):
-                                if re.match(r'^\d{2}/\d{2}/\d{4}$', tok):
+                                if self._RE_DATA.match(tok):
                                     date_idx = idx
                                     break
                                     
@@ -2264,27 +2516,27 @@ class KiJoiaExtractor(PdfExtractor):
                     for page in pdf.pages:
                         text = page.extract_text() or ""
                         
-                        m_pedido = re.search(r'N[uú]mero do Pedido:\s*(\d+)', text)
+                        m_pedido = self._RE_PEDIDO.search(text)
                         if m_pedido:
                             info_cabecalho['Nº Pedido'] = m_pedido.group(1).strip()
                             
-                        m_cnpj = re.search(r'CNPJ:\s*([\d\.\/\-]+)', text)
+                        m_cnpj = self._RE_CNPJ.search(text)
                         if m_cnpj:
                             info_cabecalho['CNPJ Loja'] = m_cnpj.group(1).strip()
                             
-                        m_loja = re.search(r'Empresa do Pedido:\s*(.+?)(?:\n|$)', text)
+                        m_loja = self._RE_LOJA.search(text)
                         if m_loja:
                             info_cabecalho['Loja'] = m_loja.group(1).strip()
                             
-                        m_forn = re.search(r'Fornecedor:\s*(.+?)(?:\n|$)', text)
+                        m_forn = self._RE_FORNECEDOR.search(text)
                         if m_forn:
                             info_cabecalho['Fornecedor'] = m_forn.group(1).strip()
                             
-                        m_data = re.search(r'Data do Pedido:\s*([\d\/]+)', text)
+                        m_data = self._RE_DATA_PEDIDO.search(text)
                         if m_data:
                             info_cabecalho['Data Pedido'] = m_data.group(1).strip()
                             
-                        m_prev = re.search(r'Previs[aã]o de entrega:\s*([\d\/]+)', text)
+                        m_prev = self._RE_PREVISAO.search(text)
                         if m_prev:
                             info_cabecalho['Previsão Entrega'] = m_prev.group(1).strip()
 
@@ -2294,7 +2546,7 @@ class KiJoiaExtractor(PdfExtractor):
                             if not line_limpa:
                                 continue
                             
-                            if re.match(r'^\d+\s+\d+\s+', line_limpa):
+                            if self._RE_INICIO_PRODUTO.match(line_limpa):
                                 match = self._RE_PRODUTO.match(line_limpa)
                                 if match:
                                     item = {
@@ -2362,6 +2614,48 @@ class ZebuExtractor(PdfExtractor):
     - Totais e dados adicionais na última página
     """
 
+    _RE_PEDIDO        = re.compile(r'PEDIDO\s+DE\s+COMPRAS\s+([\dA-Z\/]+)', re.IGNORECASE)
+    _RE_CNPJ          = re.compile(r'\d{2}\.\d{3}\.\d{3}\/\d{4}-\d{2}')
+    _RE_VALOR_TOTAL   = re.compile(r'Valor total do pedido\s+([\d\.,]+)')
+    _RE_DATA          = re.compile(r'(\d{2}/\d{2}/\d{4})')
+    _RE_FRETE         = re.compile(r'frete\s+(\w+)', re.IGNORECASE)
+    _RE_DECIMAL       = re.compile(r'[\d]+,[\d]+')
+    _RE_EANS          = re.compile(r'EANs?:\s*([\d,\s]+)')
+    _RE_TRECHO_EANS   = re.compile(r'EANs?:\s*[\d,\s]+')
+    _RE_INICIO_CODIGO = re.compile(r'^\d{4,6}\s')
+    # Listas de termos, cada uma numa alternância compilada: uma busca por linha
+    # Bloqueadores: linhas que encerram a seção de produtos (comparados com a linha em maiúsculas)
+    _BLOQUEADORES = (
+        'TOTAIS', 'DADOS ADICIONAIS', 'TOTVSVAREJO', 'RELPEDSUPRIM',
+        'TOTVS Varejo', 'JUSTIFICATIVA', 'ADVERTÊNCIA', 'ADVERT',
+    )
+    # Termos que indicam início de cabeçalho de página repetida (ignorar)
+    _CABECALHO_TERMOS = (
+        'R. Social', 'Bairro', 'Cidade', 'Cep', 'Inscrição', 'Inscri',
+        'ENDEREÇO PARA', 'Transportador', 'Cod Forn', 'Valor Unit',
+        'FORNECEDOR', 'DADOS PARA FATURAMENTO', '(Unt.)', '(Tot.)',
+    )
+    # Dados de rodapé que não entram na descrição do produto
+    _IGNORAR = (
+        'Prazo', 'Desconto', 'Taxa', 'Data', 'Previsão', 'Volume',
+        'Peso', 'UBERABA', 'ZEBU CARNES', 'Nro pedido', 'OBSERVA',
+    )
+    _RE_BLOQUEADORES = re.compile('|'.join(re.escape(termo.upper()) for termo in _BLOQUEADORES))
+    _RE_CABECALHO_TERMOS = re.compile('|'.join(map(re.escape, _CABECALHO_TERMOS)))
+    _RE_IGNORAR = re.compile('|'.join(map(re.escape, _IGNORAR)))
+    _RE_LETRA         = re.compile(r'[A-Za-z]')
+
+    _RE_PRODUTO = re.compile(
+        r'^(\d{4,6})\s+'          # Código Fornecedor (4-6 dígitos)
+        r'(.+?)\s+'               # Descrição (texto)
+        r'(CX|UN|PC|KG|LT)\s+'   # Tipo embalagem
+        r'(\d+)\s+'              # Qtde por embalagem
+        r'([\d]+,[\d]+)\s+'      # Quantidade pedida
+        r'([\d]+,[\d]+)\s+'      # Valor unitário
+        r'([\d]+,[\d]+)',         # Valor total
+        re.IGNORECASE
+    )
+
     def _extract_text_by_coords(self, page):
         """Reconstrói linhas pelo eixo Y usando pdfplumber, evitando mistura de colunas."""
         try:
@@ -2395,13 +2689,15 @@ class ZebuExtractor(PdfExtractor):
 
     def extract(self, file_path):
         try:
-            texto_completo = ""
+            # Textos das páginas numa lista, unidos uma vez só no final
+            partes = []
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
                     text = self._extract_text_by_coords(page)
                     if text:
-                        texto_completo += text + "\n"
+                        partes.append(text + "\n")
 
+            texto_completo = "".join(partes)
             self.debug_text = texto_completo
             linhas = texto_completo.split('\n')
             return self._process_text(linhas)
@@ -2425,15 +2721,6 @@ class ZebuExtractor(PdfExtractor):
             'Valor Total': '',
         }
 
-    def _conv_num(self, val):
-        if isinstance(val, str):
-            val = val.strip().replace('.', '').replace(',', '.')
-            try:
-                return float(val)
-            except ValueError:
-                return 0.0
-        return val
-
     def _process_text(self, linhas):
         print("--- [ZEBU EXTRACTOR] Iniciando processamento ---")
 
@@ -2444,18 +2731,6 @@ class ZebuExtractor(PdfExtractor):
         current_produto = None
         in_produtos_section = False
 
-        # Bloqueadores: linhas que encerram a seção de produtos ou devem ser ignoradas
-        BLOQUEADORES = [
-            'TOTAIS', 'DADOS ADICIONAIS', 'TOTVSVAREJO', 'RELPEDSUPRIM',
-            'TOTVS Varejo', 'JUSTIFICATIVA', 'ADVERTÊNCIA', 'ADVERT',
-        ]
-        # Termos que indicam início de cabeçalho de página repetida (ignorar)
-        CABECALHO_TERMOS = [
-            'R. Social', 'Bairro', 'Cidade', 'Cep', 'Inscrição', 'Inscri',
-            'ENDEREÇO PARA', 'Transportador', 'Cod Forn', 'Valor Unit',
-            'FORNECEDOR', 'DADOS PARA FATURAMENTO', '(Unt.)', '(Tot.)',
-        ]
-
         for linha in linhas:
             # Normalizar espaços
             linha_limpa = ' '.join(linha.split())
@@ -2465,9 +2740,7 @@ class ZebuExtractor(PdfExtractor):
             upper = linha_limpa.upper()
 
             # ── Detectar novo pedido ──────────────────────────────────────────
-            match_pedido = re.search(
-                r'PEDIDO\s+DE\s+COMPRAS\s+([\dA-Z\/]+)', linha_limpa, re.IGNORECASE
-            )
+            match_pedido = self._RE_PEDIDO.search(linha_limpa)
             if match_pedido:
                 novo_num = match_pedido.group(1).strip()
 
@@ -2477,7 +2750,7 @@ class ZebuExtractor(PdfExtractor):
                 elif current_pedido['Número do Pedido'] != novo_num:
                     # Salvar produto e pedido anteriores
                     if current_produto and current_produto.get('Código Fornecedor'):
-                        produtos_list.append(current_produto.copy())
+                        produtos_list.append(current_produto)
                         current_produto = None
                     pedidos.append(current_pedido)
                     current_pedido = self._novo_pedido(novo_num)
@@ -2490,7 +2763,7 @@ class ZebuExtractor(PdfExtractor):
 
             # ── CNPJ Cliente ──────────────────────────────────────────────────
             if 'CNPJ' in linha_limpa and not current_pedido['CNPJ Cliente']:
-                cnpjs = re.findall(r'\d{2}\.\d{3}\.\d{3}\/\d{4}-\d{2}', linha_limpa)
+                cnpjs = self._RE_CNPJ.findall(linha_limpa)
                 for cnpj in cnpjs:
                     if cnpj != '09.201.728/0002-37':  # Não é o fornecedor
                         current_pedido['CNPJ Cliente'] = cnpj
@@ -2498,70 +2771,59 @@ class ZebuExtractor(PdfExtractor):
 
             # ── Dados finais (última página) ──────────────────────────────────
             if 'Valor total do pedido' in linha_limpa:
-                m = re.search(r'Valor total do pedido\s+([\d\.,]+)', linha_limpa)
+                m = self._RE_VALOR_TOTAL.search(linha_limpa)
                 if m:
                     current_pedido['Valor Total'] = m.group(1)
 
             if 'Data da emiss' in linha_limpa:
-                m = re.search(r'(\d{2}/\d{2}/\d{4})', linha_limpa)
+                m = self._RE_DATA.search(linha_limpa)
                 if m:
                     current_pedido['Data Emissão'] = m.group(1)
 
             if 'Previs' in linha_limpa and 'entrega' in linha_limpa.lower():
-                m = re.search(r'(\d{2}/\d{2}/\d{4})', linha_limpa)
+                m = self._RE_DATA.search(linha_limpa)
                 if m:
                     current_pedido['Previsão Entrega'] = m.group(1)
 
             if 'Data limite para entrega' in linha_limpa:
-                m = re.search(r'(\d{2}/\d{2}/\d{4})', linha_limpa)
+                m = self._RE_DATA.search(linha_limpa)
                 if m:
                     current_pedido['Data Limite Entrega'] = m.group(1)
 
             if 'Condi' in linha_limpa and 'frete' in linha_limpa.lower():
-                m = re.search(r'frete\s+(\w+)', linha_limpa, re.IGNORECASE)
+                m = self._RE_FRETE.search(linha_limpa)
                 if m:
                     current_pedido['Condição Frete'] = m.group(1)
 
             # ── Fim da seção de produtos ──────────────────────────────────────
-            if any(b.upper() in upper for b in BLOQUEADORES):
+            if self._RE_BLOQUEADORES.search(upper):
                 if current_produto and current_produto.get('Código Fornecedor'):
-                    produtos_list.append(current_produto.copy())
+                    produtos_list.append(current_produto)
                     current_produto = None
                 in_produtos_section = False
 
                 # Capturar TOTAIS da linha
                 if 'TOTAIS' in upper:
-                    nums = re.findall(r'[\d]+,[\d]+', linha_limpa)
+                    nums = self._RE_DECIMAL.findall(linha_limpa)
                     if len(nums) >= 2 and not current_pedido['Valor Total']:
                         current_pedido['Valor Total'] = nums[1]  # Segundo = valor bruto
                 continue
 
             # ── Pular cabeçalhos repetidos ────────────────────────────────────
-            if any(t in linha_limpa for t in CABECALHO_TERMOS):
+            if self._RE_CABECALHO_TERMOS.search(linha_limpa):
                 continue
 
             # ── Detectar início de seção de produtos ──────────────────────────
             # Linha que começa com código (5-6 dígitos) seguida de tipo de produto
             # e embalagem e números: ex: "8643 EXTRATO TOM CX 48 2,00 155,5200 ..."
             # Formato: <CodForn> <Desc...> <Emb> <QtdEmb> <Qtde> <ValUnit> <ValTotal> ...zeros
-            regex_produto = re.compile(
-                r'^(\d{4,6})\s+'          # Código Fornecedor (4-6 dígitos)
-                r'(.+?)\s+'               # Descrição (texto)
-                r'(CX|UN|PC|KG|LT)\s+'   # Tipo embalagem
-                r'(\d+)\s+'              # Qtde por embalagem
-                r'([\d]+,[\d]+)\s+'      # Quantidade pedida
-                r'([\d]+,[\d]+)\s+'      # Valor unitário
-                r'([\d]+,[\d]+)',         # Valor total
-                re.IGNORECASE
-            )
-
-            m_prod = regex_produto.match(linha_limpa)
+            m_prod = self._RE_PRODUTO.match(linha_limpa)
 
             if m_prod:
                 in_produtos_section = True
                 # Salvar produto anterior
                 if current_produto and current_produto.get('Código Fornecedor'):
-                    produtos_list.append(current_produto.copy())
+                    produtos_list.append(current_produto)
 
                 desc_raw = m_prod.group(2).strip()
                 emb_tipo = m_prod.group(3).upper()
@@ -2582,7 +2844,7 @@ class ZebuExtractor(PdfExtractor):
 
             # ── Linha de EAN ──────────────────────────────────────────────────
             if 'EANs:' in linha_limpa and current_produto:
-                m_ean = re.search(r'EANs?:\s*([\d,\s]+)', linha_limpa)
+                m_ean = self._RE_EANS.search(linha_limpa)
                 if m_ean:
                     # Pega o primeiro EAN (pode haver múltiplos separados por vírgula)
                     eans = m_ean.group(1).replace(' ', '').split(',')
@@ -2592,12 +2854,12 @@ class ZebuExtractor(PdfExtractor):
 
                 # Verificar se a linha de EAN vem junto com próximo produto
                 # ex: "EANs: 7896036000793  36130  EXTRATO TOM  CX  24  1,00  ..."
-                resto = re.sub(r'EANs?:\s*[\d,\s]+', '', linha_limpa).strip()
+                resto = self._RE_TRECHO_EANS.sub('', linha_limpa).strip()
                 if resto:
-                    m_prox = regex_produto.match(resto)
+                    m_prox = self._RE_PRODUTO.match(resto)
                     if m_prox:
                         if current_produto and current_produto.get('Código Fornecedor'):
-                            produtos_list.append(current_produto.copy())
+                            produtos_list.append(current_produto)
                         desc_raw = m_prox.group(2).strip()
                         emb_tipo = m_prox.group(3).upper()
                         emb_qtd = m_prox.group(4)
@@ -2617,21 +2879,17 @@ class ZebuExtractor(PdfExtractor):
             # ── Continuação de descrição (linha sem número no início) ─────────
             if in_produtos_section and current_produto:
                 # Ignorar linhas que são claramente dados de rodapé
-                ignorar = [
-                    'Prazo', 'Desconto', 'Taxa', 'Data', 'Previsão', 'Volume',
-                    'Peso', 'UBERABA', 'ZEBU CARNES', 'Nro pedido', 'OBSERVA',
-                ]
-                if any(ig in linha_limpa for ig in ignorar):
+                if self._RE_IGNORAR.search(linha_limpa):
                     continue
                 # Linha de continuação da descrição (não começa com número de produto)
-                if not re.match(r'^\d{4,6}\s', linha_limpa) and 'EANs:' not in linha_limpa:
+                if not self._RE_INICIO_CODIGO.match(linha_limpa) and 'EANs:' not in linha_limpa:
                     # Checar se é texto descritivo (tem pelo menos uma letra)
-                    if re.search(r'[A-Za-z]', linha_limpa) and len(linha_limpa) > 2:
+                    if self._RE_LETRA.search(linha_limpa) and len(linha_limpa) > 2:
                         current_produto['Descrição'] += ' ' + linha_limpa
 
         # Salvar últimos registros
         if current_produto and current_produto.get('Código Fornecedor'):
-            produtos_list.append(current_produto.copy())
+            produtos_list.append(current_produto)
         if current_pedido:
             pedidos.append(current_pedido)
 
@@ -2652,7 +2910,7 @@ class ZebuExtractor(PdfExtractor):
             # Converter colunas numéricas
             for col in ['Quantidade', 'Valor Unit.', 'Valor Total Item']:
                 if col in df_produtos.columns:
-                    df_produtos[col] = df_produtos[col].apply(self._conv_num)
+                    df_produtos[col] = numeros_br(df_produtos[col])
 
             # Converter Código Fornecedor para inteiro
             if 'Código Fornecedor' in df_produtos.columns:
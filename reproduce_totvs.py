@@ -1,8 +1,7 @@
 
 import sys
 import os
-import PyPDF2
-from extractors import RedeBizExtractor, MondelezExtractor
+from extractors import RedeBizExtractor, MondelezExtractor, textos_do_arquivo
 
 def dump_text():
     file_path = "rede_biz.pdf"
@@ -11,13 +10,12 @@ def dump_text():
         return
 
     print(f"Dumping text from {file_path}...")
-    texto_completo = ""
-    with open(file_path, 'rb') as file:
-        reader = PyPDF2.PdfReader(file)
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                texto_completo += text + "\n"
+    # Same source RedeBizExtractor.extract() parses: the (cached) PyPDF2 page texts
+    partes = []
+    for text in textos_do_arquivo(file_path):
+        if text:
+            partes.append(text + "\n")
+    texto_completo = "".join(partes)
     
     with open("debug_totvs_text.txt", "w", encoding="utf-8") as f:
         f.write(texto_completo)
@@ -25,7 +23,8 @@ def dump_text():
 
     # Run extraction and save output
     extractor = RedeBizExtractor()
-    dfs = extractor.extract(file_path)
+    # Parse the text dumped above instead of reading the PDF again
+    dfs = extractor.extract_from_text(texto_completo)
     with open("debug_totvs_result.txt", "w", encoding="utf-8") as f:
         f.write(f"Found {len(dfs)} tables.\n")
         for i, df in enumerate(dfs):